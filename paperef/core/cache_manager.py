@@ -3,12 +3,32 @@ Cache Manager Module
 Intelligent caching system with TTL, size management, and performance optimization
 """
 
+import atexit
 import json
+import os
 import time
+import weakref
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+# Optional SIMD-accelerated JSON; stdlib json remains the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Live managers flushed at interpreter shutdown; a WeakSet so the shutdown
+# hook does not pin every instance for process lifetime
+_live_managers: weakref.WeakSet = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    for manager in list(_live_managers):
+        manager.flush()
+
 
 class CacheEntry:
     """Cache entry with TTL support"""
@@ -23,20 +43,22 @@ class CacheEntry:
         """
         self.value = value
         self.ttl = ttl
-        self.created_at = time.time()
+        # Monotonic clock: immune to NTP adjustments jumping wall time
+        self.created_at = time.monotonic()
 
     def is_expired(self) -> bool:
         """Check if entry is expired"""
         if self.ttl is None:
             return False
-        return (time.time() - self.created_at) > self.ttl
+        return (time.monotonic() - self.created_at) > self.ttl
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
             "value": self.value,
             "ttl": self.ttl,
-            "created_at": self.created_at
+            # Persist as wall-clock epoch (monotonic is process-local)
+            "created_at": time.time() - (time.monotonic() - self.created_at)
         }
 
     @classmethod
@@ -45,7 +67,8 @@ class CacheEntry:
         entry = cls.__new__(cls)
         entry.value = data["value"]
         entry.ttl = data["ttl"]
-        entry.created_at = data["created_at"]
+        # Translate the persisted epoch back onto this process's monotonic clock
+        entry.created_at = time.monotonic() - (time.time() - data["created_at"])
         return entry
 
 
@@ -73,9 +96,18 @@ class CacheManager:
         self._misses = 0
         self._expired_count = 0
 
+        # Write-back state: set() batches disk writes behind this interval
+        self._dirty = False
+        self._last_flush = 0.0
+        self._write_interval = 2.0
+
         # Load existing cache
         self._load_cache()
 
+        # Make sure deferred writes reach disk at interpreter shutdown
+        # (WeakSet so the hook does not pin instances for process lifetime)
+        _live_managers.add(self)
+
     def get(self, key: str) -> Any:
         """
         Get value from cache
@@ -86,12 +118,11 @@ class CacheManager:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             self._misses += 1
             return None
 
-        entry = self._cache[key]
-
         # Check expiration
         if entry.is_expired():
             self._expired_count += 1
@@ -131,11 +162,14 @@ class CacheManager:
             self._cache.move_to_end(key)
 
             # Check size limit
-            if len(self._cache) > self.max_size:
+            while len(self._cache) > self.max_size:
                 self._evict_oldest()
 
-        # Save to disk
-        self._save_cache()
+        # Mark dirty; flush at most once per write interval so bulk
+        # ingestion does O(N) bytes of disk I/O instead of O(N^2)
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self._write_interval:
+            self.flush()
 
     def delete(self, key: str) -> bool:
         """
@@ -149,7 +183,8 @@ class CacheManager:
         """
         if key in self._cache:
             del self._cache[key]
-            self._save_cache()
+            self._dirty = True
+            self.flush()
             return True
         return False
 
@@ -159,7 +194,8 @@ class CacheManager:
         self._hits = 0
         self._misses = 0
         self._expired_count = 0
-        self._save_cache()
+        self._dirty = True
+        self.flush()
 
     def cleanup_expired(self) -> int:
         """
@@ -177,7 +213,8 @@ class CacheManager:
             del self._cache[key]
 
         if expired_keys:
-            self._save_cache()
+            self._dirty = True
+            self.flush()
 
         return len(expired_keys)
 
@@ -205,11 +242,49 @@ class CacheManager:
         """Get all cache keys"""
         return list(self._cache.keys())
 
+    def flush(self) -> None:
+        """Write deferred changes to disk if there are any"""
+        if not self._dirty:
+            return
+
+        self._save_cache()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
     def _evict_oldest(self) -> None:
-        """Evict oldest entry (LRU)"""
+        """Evict least-recently-used entry in O(1)"""
         if self._cache:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
+            self._cache.popitem(last=False)
+
+    def _deserialize(self) -> dict[str, Any]:
+        """Read and parse the cache file (orjson when available)"""
+        if orjson is not None:
+            return orjson.loads(self.cache_file.read_bytes())
+
+        with open(self.cache_file, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _serialize(self, data: dict[str, Any]) -> None:
+        """Render and write the cache file atomically (orjson when available)"""
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+
+        rendered = None
+        if orjson is not None:
+            try:
+                rendered = orjson.dumps(data)
+            except TypeError:
+                # orjson is stricter than stdlib json (e.g. rejects non-str
+                # dict keys); fall back instead of failing the save
+                rendered = None
+
+        if rendered is not None:
+            tmp_file.write_bytes(rendered)
+        else:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+        # Atomic swap so readers never observe a half-written cache
+        os.replace(tmp_file, self.cache_file)
 
     def _load_cache(self) -> None:
         """Load cache from disk"""
@@ -217,8 +292,7 @@ class CacheManager:
             return
 
         try:
-            with open(self.cache_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._deserialize()
 
             # Load entries
             for key, entry_data in data.items():
@@ -231,8 +305,9 @@ class CacheManager:
                     # Skip invalid entries
                     continue
 
-        except (OSError, json.JSONDecodeError):
+        except (OSError, ValueError):
             # If cache file is corrupt, start fresh
+            # (covers json.JSONDecodeError and orjson.JSONDecodeError)
             self._cache.clear()
 
     def _save_cache(self) -> None:
@@ -248,8 +323,7 @@ class CacheManager:
                 if not entry.is_expired():
                     data[key] = entry.to_dict()
 
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._serialize(data)
 
         except OSError:
             # If we can't save, continue without error
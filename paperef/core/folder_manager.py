@@ -4,11 +4,71 @@ Handles PDF title-based automatic folder creation and management
 """
 
 import contextlib
+import functools
+import json
+import os
 import re
+import shutil
 import time
+import unicodedata
+import uuid
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from paperef.utils.file_utils import write_binary_file
+
+# 파일 시스템 안전하지 않은 문자 + 공백류를 밑줄로 치환하는 변환 테이블
+# (Windows/Unix 모두에서 문제되는 문자들, 마침표, 따옴표, 하이픈 포함)
+_UNSAFE_TRANSLATE = str.maketrans(dict.fromkeys(
+    "<>:\"/\\|?*'-." + "".join(chr(i) for i in range(32)) + " \t\r\f\v", "_"
+))
+
+# 폴더 요약에서 이미지로 집계하는 확장자들
+_IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif"})
+
+# 폴더명 검증용: 안전하지 않은 문자 패턴과 Windows 예약어
+_NAME_UNSAFE_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_RESERVED_NAMES = frozenset(
+    ["CON", "PRN", "AUX", "NUL"]
+    + [f"COM{i}" for i in range(1, 10)]
+    + [f"LPT{i}" for i in range(1, 10)]
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_title(title: str, max_length: int) -> str:
+    """제목을 안전한 폴더명으로 변환 (순수 함수이므로 결과를 메모이즈)"""
+    # 유니코드 정규화 및 ASCII 변환
+    clean_title = unicodedata.normalize("NFKD", title)
+    clean_title = clean_title.encode("ASCII", "ignore").decode("ASCII")
+
+    # 안전하지 않은 문자/공백류를 밑줄로 변환 (한 번의 translate 패스)
+    clean_title = clean_title.translate(_UNSAFE_TRANSLATE)
+
+    # 연속된 밑줄을 하나로 정리하고 앞뒤 밑줄 제거 (C 레벨 split/join이 regex보다 빠름)
+    clean_title = "_".join(part for part in clean_title.split("_") if part)
+
+    # 빈 문자열이 된 경우 처리
+    if not clean_title:
+        return "untitled"
+
+    # 길이 제한 적용
+    if len(clean_title) > max_length:
+        clean_title = clean_title[:max_length].rstrip("_")
+
+    return clean_title
+
+
+def _scandir_recursive(path: os.PathLike | str) -> Iterator[os.DirEntry]:
+    """os.scandir 기반 재귀 순회 (DirEntry 캐시를 활용해 stat 호출 최소화)"""
+    # 읽을 수 없거나 동시에 삭제된 디렉토리는 건너뜀 (rglob의 관용과 동일)
+    with contextlib.suppress(OSError), os.scandir(path) as it:
+        for entry in it:
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+
 
 class FolderManager:
     """PDF 제목 기반 자동 폴더 생성 및 관리 클래스"""
@@ -28,18 +88,15 @@ class FolderManager:
         Returns:
             생성된 폴더의 Path 객체
         """
-        # 출력 디렉토리가 존재하지 않으면 생성
-        output_dir.mkdir(parents=True, exist_ok=True)
-
         # 제목으로부터 폴더명 생성
         folder_name = self._generate_folder_name(title)
 
-        # 중복 방지를 위한 최종 폴더명 생성
+        # 중복 방지를 위한 최종 폴더명 생성 (출력 디렉토리가 없으면 중복도 없음)
         final_folder_name = self._resolve_duplicate_name(folder_name, output_dir)
 
-        # 폴더 생성
+        # 출력 디렉토리와 논문 폴더를 mkdir 한 번으로 생성
         paper_folder = output_dir / final_folder_name
-        paper_folder.mkdir(exist_ok=True)
+        paper_folder.mkdir(parents=True, exist_ok=True)
 
         return paper_folder
 
@@ -57,40 +114,8 @@ class FolderManager:
         if not title or not title.strip():
             return "untitled"
 
-        # 제목 정리
-        clean_title = title.strip()
-
-        # 유니코드 정규화 및 ASCII 변환
-        import unicodedata
-        clean_title = unicodedata.normalize("NFKD", clean_title)
-        clean_title = clean_title.encode("ASCII", "ignore").decode("ASCII")
-
-        # 파일 시스템 안전하지 않은 문자들을 밑줄로 변환
-        # Windows와 Unix 모두에서 문제되는 문자들 처리
-        unsafe_chars = r'[<>:"/\\|?*\x00-\x1f\'"-]'
-        clean_title = re.sub(unsafe_chars, "_", clean_title)
-
-        # 마침표(.)를 밑줄로 변환 (파일 확장자 구분 방지)
-        clean_title = clean_title.replace(".", "_")
-
-        # 추가 정리: 여러 공백을 하나로, 공백을 밑줄로
-        clean_title = re.sub(r"\s+", "_", clean_title)
-
-        # 연속된 밑줄을 하나로 정리
-        clean_title = re.sub(r"_+", "_", clean_title)
-
-        # 앞뒤 밑줄 제거
-        clean_title = clean_title.strip("_")
-
-        # 빈 문자열이 된 경우 처리
-        if not clean_title:
-            return "untitled"
-
-        # 길이 제한 적용
-        if len(clean_title) > self.max_folder_name_length:
-            clean_title = clean_title[:self.max_folder_name_length].rstrip("_")
-
-        return clean_title
+        # 같은 제목이 반복되는 배치 처리에서 정규화 파이프라인 재실행 방지
+        return _sanitize_title(title.strip(), self.max_folder_name_length)
 
     def _resolve_duplicate_name(self, base_name: str, output_dir: Path) -> str:
         """
@@ -103,20 +128,32 @@ class FolderManager:
         Returns:
             중복 해결된 폴더명
         """
-        candidate_name = base_name
-        counter = 1
-
-        while (output_dir / candidate_name).exists():
-            candidate_name = f"{base_name}_{counter}"
-            counter += 1
-
-            # 무한 루프 방지 (1000번까지 시도)
-            if counter > 1000:
-                import uuid
-                candidate_name = f"{base_name}_{uuid.uuid4().hex[:8]}"
-                break
-
-        return candidate_name
+        # 디렉토리 목록을 한 번만 읽어 메모리에서 중복 검사 (항목당 stat 호출 제거)
+        try:
+            with os.scandir(output_dir) as it:
+                existing = {entry.name for entry in it}
+        except FileNotFoundError:
+            # 디렉토리가 아직 없으면 중복도 없음
+            return base_name
+
+        if base_name not in existing:
+            return base_name
+
+        # 기존 base(_N) 이름들 중 최대 N을 찾아 한 번에 다음 번호 결정
+        # (N개의 후보를 순차 확인하는 대신 목록 한 번 순회)
+        suffix_re = re.compile(rf"^{re.escape(base_name)}(?:_(\d+))?$")
+        max_suffix = 0
+        for name in existing:
+            match = suffix_re.match(name)
+            if match:
+                max_suffix = max(max_suffix, int(match.group(1) or 0))
+
+        candidate_name = f"{base_name}_{max_suffix + 1}"
+        if candidate_name not in existing:
+            return candidate_name
+
+        # 경합 등으로 여전히 충돌하면 무작위 접미사로 탈출
+        return f"{base_name}_{uuid.uuid4().hex[:8]}"
 
     def get_folder_structure(self, paper_dir: Path) -> dict[str, Any]:
         """
@@ -140,20 +177,22 @@ class FolderManager:
         if not paper_dir.exists():
             return structure
 
-        # 파일들 확인
-        paper_md = paper_dir / "paper.md"
-        paper_bib = paper_dir / "paper.bib"
-        references_dir = paper_dir / "references"
-        artifacts_dir = paper_dir / "artifacts"
-
-        if paper_md.exists():
-            structure["paper_md"] = paper_md
-        if paper_bib.exists():
-            structure["paper_bib"] = paper_bib
-        if references_dir.exists() and references_dir.is_dir():
-            structure["references_dir"] = references_dir
-        if artifacts_dir.exists() and artifacts_dir.is_dir():
-            structure["artifacts_dir"] = artifacts_dir
+        # 디렉토리를 한 번만 읽어 DirEntry 캐시로 모든 질문에 응답
+        with os.scandir(paper_dir) as it:
+            entries = {entry.name: entry for entry in it}
+
+        if "paper.md" in entries:
+            structure["paper_md"] = paper_dir / "paper.md"
+        if "paper.bib" in entries:
+            structure["paper_bib"] = paper_dir / "paper.bib"
+
+        references_entry = entries.get("references")
+        if references_entry is not None and references_entry.is_dir(follow_symlinks=False):
+            structure["references_dir"] = paper_dir / "references"
+
+        artifacts_entry = entries.get("artifacts")
+        if artifacts_entry is not None and artifacts_entry.is_dir(follow_symlinks=False):
+            structure["artifacts_dir"] = paper_dir / "artifacts"
 
         return structure
 
@@ -167,14 +206,23 @@ class FolderManager:
         if not base_dir.exists():
             return
 
-        # 재귀적으로 모든 하위 디렉토리 확인
-        for path in sorted(base_dir.rglob("*"), reverse=True):
-            if path.is_dir() and not any(path.iterdir()):
-                try:
-                    path.rmdir()
-                except OSError:
-                    # 권한 문제 등으로 삭제 실패한 경우 무시
-                    pass
+        # 명시적 스택 기반 2단계 순회 (재귀 프레임/정렬 비용 없이 깊은 트리도 안전)
+        # 1단계: 디렉토리당 scandir 1회로 하위 디렉토리 수집
+        stack = [os.fspath(base_dir)]
+        post: list[str] = []
+        while stack:
+            current = stack.pop()
+            # 읽을 수 없거나 동시에 삭제된 디렉토리는 건너뜀
+            with contextlib.suppress(OSError), os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        post.append(entry.path)
+                        stack.append(entry.path)
+
+        # 2단계: 자손이 조상보다 먼저 오도록 역순으로 rmdir (비어있지 않으면 실패)
+        for dir_path in reversed(post):
+            with contextlib.suppress(OSError):
+                os.rmdir(dir_path)
 
     def validate_folder_name(self, name: str) -> bool:
         """
@@ -186,29 +234,16 @@ class FolderManager:
         Returns:
             유효하면 True, 아니면 False
         """
-        if not name or not name.strip():
-            return False
-
-        # 파일 시스템 안전하지 않은 문자들 확인
-        unsafe_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        if re.search(unsafe_chars, name):
+        # 저렴한 검사부터: 빈 문자열, 길이 제한 (일반적인 파일 시스템 제한 255)
+        if not name or not name.strip() or len(name) > 255:
             return False
 
         # 예약어 확인 (Windows)
-        reserved_names = {
-            "CON", "PRN", "AUX", "NUL",
-            "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
-            "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"
-        }
-
-        if name.upper() in reserved_names:
-            return False
-
-        # 길이 확인
-        if len(name) > 255:  # 일반적인 파일 시스템 제한
+        if name.upper() in _RESERVED_NAMES:
             return False
 
-        return True
+        # 파일 시스템 안전하지 않은 문자들 확인
+        return _NAME_UNSAFE_RE.search(name) is None
 
     def ensure_paper_folder_structure(self, paper_dir: Path) -> dict:
         """
@@ -240,25 +275,35 @@ class FolderManager:
             "README.md"       # 폴더 설명 파일
         ]
 
-        # 디렉토리 생성
+        # Path 연산 대신 문자열 결합 사용 (반복문에서 PurePath 파싱 비용 제거)
+        base = os.fspath(paper_dir)
+
+        # paper_dir 자체가 없으면 먼저 생성 (기존 mkdir(parents=True) 동작 유지)
+        os.makedirs(base, exist_ok=True)
+
+        # 디렉토리 생성 (사전 exists 검사 없이 mkdir 실패로 중복 판단)
         for dir_name in standard_dirs:
-            dir_path = paper_dir / dir_name
-            if not dir_path.exists():
-                dir_path.mkdir(parents=True, exist_ok=True)
-                created_items["directories"].append(str(dir_path))
+            dir_path = os.path.join(base, dir_name)
+            try:
+                os.mkdir(dir_path)
+                created_items["directories"].append(dir_path)
+            except FileExistsError:
+                pass
 
-        # 기본 파일들 생성 (없는 경우에만)
+        # 기본 파일들 생성 (없는 경우에만, O_EXCL로 원자적 생성)
         for file_name in standard_files:
-            file_path = paper_dir / file_name
-            if not file_path.exists():
-                if file_name == "README.md":
-                    self._create_default_readme(file_path)
-                elif file_name == "metadata.json":
-                    self._create_default_metadata(file_path)
-                else:
-                    # 다른 파일들은 빈 파일로 생성
-                    file_path.touch()
-                created_items["files"].append(str(file_path))
+            file_path = os.path.join(base, file_name)
+            try:
+                fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                continue
+            os.close(fd)
+
+            if file_name == "README.md":
+                self._create_default_readme(Path(file_path))
+            elif file_name == "metadata.json":
+                self._create_default_metadata(Path(file_path))
+            created_items["files"].append(file_path)
 
         return created_items
 
@@ -283,26 +328,28 @@ class FolderManager:
             validation["issues"].append("Paper directory does not exist")
             return validation
 
+        # 디렉토리를 한 번만 읽어 필수/권장 항목을 모두 확인
+        with os.scandir(paper_dir) as it:
+            entries = {entry.name: entry for entry in it}
+
         # 필수 파일들 확인
         required_files = ["paper.md", "paper.bib"]
         for file_name in required_files:
-            file_path = paper_dir / file_name
-            if not file_path.exists():
+            if file_name not in entries:
                 validation["issues"].append(f"Missing required file: {file_name}")
                 validation["is_valid"] = False
 
         # 권장 폴더들 확인
         recommended_dirs = ["artifacts", "references"]
         for dir_name in recommended_dirs:
-            dir_path = paper_dir / dir_name
-            if not dir_path.exists():
+            if dir_name not in entries:
                 validation["recommendations"].append(f"Consider creating directory: {dir_name}")
 
-        # artifacts 폴더에 파일이 있는지 확인
-        artifacts_dir = paper_dir / "artifacts"
-        if artifacts_dir.exists():
-            image_files = list(artifacts_dir.glob("*.png")) + list(artifacts_dir.glob("*.jpg"))
-            if not image_files:
+        # artifacts 폴더에 이미지 파일이 있는지 확인 (첫 발견 시 조기 종료)
+        if "artifacts" in entries:
+            with os.scandir(paper_dir / "artifacts") as it:
+                has_images = any(entry.name.endswith((".png", ".jpg")) for entry in it)
+            if not has_images:
                 validation["recommendations"].append("No image files found in artifacts directory")
 
         return validation
@@ -328,13 +375,17 @@ class FolderManager:
             if not folder.is_dir():
                 continue
 
-            # 폴더 내 파일 수 확인
-            file_count = sum(1 for item in folder.rglob("*") if item.is_file())
+            # 폴더 내 파일 수 확인 (최소 요구 수에 도달하면 조기 종료)
+            file_count = 0
+            for entry in _scandir_recursive(folder):
+                if entry.is_file(follow_symlinks=False):
+                    file_count += 1
+                    if file_count >= min_files:
+                        break
 
             # 최소 파일 수 미만인 경우 삭제
             if file_count < min_files:
                 try:
-                    import shutil
                     shutil.rmtree(folder)
                     deleted_folders.append(str(folder))
                 except Exception as e:
@@ -366,38 +417,40 @@ class FolderManager:
         if not paper_dir.exists():
             return summary
 
-        # 폴더 내 모든 파일 분석
-        for file_path in paper_dir.rglob("*"):
-            if not file_path.is_file():
+        # 폴더 내 모든 파일 분석 (DirEntry.stat()은 readdir 버퍼에서 제공됨)
+        for entry in _scandir_recursive(paper_dir):
+            if not entry.is_file(follow_symlinks=False):
                 continue
 
             summary["file_count"] += 1
 
-            # 파일 크기 합산
-            with contextlib.suppress(OSError):
-                summary["total_size"] += file_path.stat().st_size
+            # 파일 크기 및 마지막 수정 시간 (stat 1회)
+            try:
+                stat_result = entry.stat()
+            except OSError:
+                stat_result = None
+
+            if stat_result is not None:
+                summary["total_size"] += stat_result.st_size
+                summary["last_modified"] = max(
+                    summary["last_modified"] or 0, stat_result.st_mtime
+                )
 
             # 파일 타입별 카운트
-            if file_path.suffix.lower() in [".png", ".jpg", ".jpeg", ".gif"]:
+            name = entry.name
+            suffix = os.path.splitext(name)[1].lower()
+            if suffix in _IMAGE_SUFFIXES:
                 summary["image_count"] += 1
 
-            if file_path.suffix.lower() == ".bib":
-                summary["bib_files"].append(file_path.name)
+            if suffix == ".bib":
+                summary["bib_files"].append(name)
 
-            if file_path.name == "paper.md":
+            if name == "paper.md":
                 summary["has_markdown"] = True
 
-            if file_path.name == "paper.bib":
+            if name == "paper.bib":
                 summary["has_bibtex"] = True
 
-            # 마지막 수정 시간 업데이트
-            try:
-                mtime = file_path.stat().st_mtime
-                if summary["last_modified"] is None or mtime > summary["last_modified"]:
-                    summary["last_modified"] = mtime
-            except OSError:
-                pass
-
         return summary
 
     def _create_default_readme(self, readme_path: Path) -> None:
@@ -417,11 +470,10 @@ This folder contains processed academic paper data.
 - Processed by: PaperRef
 - Processing date: {time.strftime('%Y-%m-%d %H:%M:%S')}
 """
-        readme_path.write_text(content, encoding="utf-8")
+        write_binary_file(readme_path, content.encode("utf-8"))
 
     def _create_default_metadata(self, metadata_path: Path) -> None:
         """기본 메타데이터 파일 생성"""
-        import json
         metadata = {
             "processing_tool": "PaperRef",
             "processing_date": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -433,4 +485,4 @@ This folder contains processed academic paper data.
                 "references": "BibTeX files for citations"
             }
         }
-        metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+        write_binary_file(metadata_path, json.dumps(metadata, indent=2).encode("utf-8"))
@@ -3,42 +3,171 @@ PDF processing and Docling integration module
 """
 
 import hashlib
+import os
 import re
-from dataclasses import dataclass
+import shutil
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from paperef.utils.config import Config
-from paperef.utils.file_utils import ensure_directory
+from paperef.utils.file_utils import ensure_directory, get_file_hash, write_binary_file
 
+# PyMuPDF is imported lazily: importing fitz costs ~150ms, which would be
+# paid on every CLI start (including --help) and every test collection even
+# when no PDF is ever opened
+fitz = None
+_fitz_unchecked = True
 
-@dataclass
+
+def _load_fitz():
+    """Import PyMuPDF on first use; returns the module or None if missing."""
+    global fitz, _fitz_unchecked
+    if _fitz_unchecked:
+        _fitz_unchecked = False
+        try:
+            import fitz as _fitz_module
+            fitz = _fitz_module
+        except ImportError:
+            fitz = None
+    return fitz
+
+# Compiled once at import; each alternation walks the page text in a single
+# scan instead of one full scan per variant pattern
+_DOI_RE = re.compile(r"\b10\.\d{4,9}/[-._;()/:A-Z0-9]+\b", re.IGNORECASE)
+_ABSTRACT_RE = re.compile(
+    r"(?:Abstract|Summary)\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+|\n\d+\.)",
+    re.DOTALL | re.IGNORECASE,
+)
+_KEYWORD_RE = re.compile(
+    r"(?:Keywords?|Key words?|Subject classifications?):\s*([^\n]+)",
+    re.IGNORECASE,
+)
+_YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2})\b")
+# Leading boundary only: PDF "D:YYYYMMDDHHmmSS" dates run the year straight
+# into the month digits, so a trailing \b would never match them
+_META_YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2})")
+_AUTHOR_RE = re.compile(
+    r"(?:Authors?:\s*|By\s+|Written by\s+)([^\n]+)"
+    r"|^([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)*[A-Z][a-z]+"
+    r"(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z]\.?\s*)*[A-Z][a-z]+)*)\s*\n",
+    re.MULTILINE,
+)
+_CAMEL_CASE_RE = re.compile(r"([a-z])([A-Z])")
+_UNDERSCORE_RE = re.compile(r"_+")
+# Single fused cleanup pattern: one linear scan handles separator runs,
+# blank-line runs (blank lines may carry stray spaces) and trailing
+# whitespace instead of one re.sub pass each
+_MD_CLEAN_RE = re.compile(
+    r"(?P<sep>(?:\n?-{3,}[ \t]*\n?){2,})"  # runs of --- separators
+    r"|(?P<nl>\n(?:[ \t]*\n){2,})"  # 3+ consecutive (possibly padded) newlines
+    r"|(?P<ws>[ \t]+(?=\n|$))"  # trailing whitespace
+)
+
+
+def _md_clean_repl(match: re.Match) -> str:
+    if match.group("sep"):
+        return "\n---\n"
+    if match.group("nl"):
+        return "\n\n"
+    return ""
+
+
+def _search_head(pattern: re.Pattern, text: str, head: int = 2048) -> re.Match | None:
+    """
+    Search the first `head` characters, falling back to the full text.
+    DOIs, abstracts, and author lines virtually always sit near the top of a
+    page, so the automaton usually never touches the remaining kilobytes.
+    """
+    match = pattern.search(text[:head])
+    if len(text) > head and (match is None or match.end() >= head):
+        # No match, or a match ending exactly at the slice boundary — the
+        # latter may be a truncated hit (e.g. a DOI cut mid-suffix), so
+        # re-run on the full text
+        match = pattern.search(text)
+    return match
+_TITLE_RE = re.compile(
+    r"^([A-Z][^.!?\n]{9,120})(?:[.!?]|$)"
+    r"|^(.+)\n(?:={3,}|-{3,})",
+    re.MULTILINE,
+)
+
+
+@dataclass(slots=True)
 class PDFMetadata:
-    """PDF metadata"""
+    """PDF metadata (slots: no per-instance __dict__, faster attribute access)"""
     title: str | None = None
-    authors: list[str] = None
+    authors: list[str] = field(default_factory=list)
     year: int | None = None
     doi: str | None = None
     abstract: str | None = None
-    keywords: list[str] = None
-
-    def __post_init__(self):
-        if self.authors is None:
-            self.authors = []
-        if self.keywords is None:
-            self.keywords = []
+    keywords: list[str] = field(default_factory=list)
 
 
 class PDFProcessor:
     """PDF processing class"""
 
+    # Shared memoization caches keyed by (path, mtime_ns, size); batch runs
+    # call extract_title/extract_metadata repeatedly for the same PDF
+    _title_cache: dict[tuple, str | None] = {}
+    _metadata_cache: dict[tuple, PDFMetadata] = {}
+    _cache_max_size = 1024
+
     def __init__(self, config: Config):
         self.config = config
-        self.docling_processor = None
-        self._init_docling()
+        self._docling = None
+        self._docling_initialized = False
+
+    @property
+    def docling_processor(self):
+        """Docling converter, constructed lazily on first use"""
+        if not self._docling_initialized:
+            self._init_docling()
+        return self._docling
+
+    @docling_processor.setter
+    def docling_processor(self, value) -> None:
+        self._docling = value
+        self._docling_initialized = True
+
+    @staticmethod
+    def _file_fingerprint(pdf_path: Path) -> tuple | None:
+        """Cheap cache key for a PDF; None if the path cannot be stat-ed"""
+        try:
+            stat_result = os.stat(pdf_path)
+            return (os.fspath(pdf_path), stat_result.st_mtime_ns, stat_result.st_size)
+        except (OSError, TypeError, ValueError):
+            # e.g. Mock paths in tests or deleted files - bypass the cache
+            return None
+
+    @classmethod
+    def _cache_store(cls, cache: dict, key: tuple, value: Any) -> None:
+        """Insert into a memoization cache, evicting the oldest entry if full"""
+        if len(cache) >= cls._cache_max_size:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the title/metadata memoization caches"""
+        cls._title_cache.clear()
+        cls._metadata_cache.clear()
 
     def _init_docling(self):
         """Initialize Docling processor"""
+        global _docling_converter
+
+        self._docling_initialized = True
+
+        # Share one converter per process; the model load behind
+        # DocumentConverter is far too heavy to repeat per instance.
+        # _raise_import_error is a test hook that must exercise the import
+        # path itself, so it bypasses the shared converter.
+        if _docling_converter is not None and not getattr(self, "_raise_import_error", False):
+            self._docling = _docling_converter
+            return
+
         try:
             from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
             from docling.datamodel.pipeline_options import PdfPipelineOptions
@@ -50,27 +179,41 @@ class PDFProcessor:
             pipeline_options.do_table_structure = True  # Table structure recognition
 
             # Create converter with options
-            self.docling_processor = DocumentConverter(
+            _docling_converter = DocumentConverter(
                 format_options={
                     "input": {"pdf": {"pipeline_options": pipeline_options}}
                 }
             )
+            self._docling = _docling_converter
 
         except ImportError as e:
             # For testing or when docling is not available
-            self.docling_processor = None
+            self._docling = None
             # Re-raise for testing purposes if this is a test environment
             if hasattr(self, "_raise_import_error") and self._raise_import_error:
                 msg = "Docling is required for PDF processing"
                 raise ImportError(msg) from e
 
     def extract_title(self, pdf_path: Path) -> str | None:
+        """Extract title from PDF (memoized per file fingerprint)"""
+        key = self._file_fingerprint(pdf_path)
+        if key is not None and key in self._title_cache:
+            return self._title_cache[key]
+
+        title = self._extract_title_uncached(pdf_path)
+
+        if key is not None:
+            self._cache_store(self._title_cache, key, title)
+
+        return title
+
+    def _extract_title_uncached(self, pdf_path: Path) -> str | None:
         """Extract title from PDF"""
         try:
+            if _load_fitz() is None:
+                raise ImportError("PyMuPDF is not available")
 
-            import fitz
-
-            opener = fitz.open(pdf_path)
+            opener = self._open_doc(pdf_path)
             exit_fn = getattr(opener, "__exit__", None)
             candidates = []
             # Prefer context-managed doc if available (tests may configure __enter__)
@@ -97,24 +240,10 @@ class PDFProcessor:
                     # 2) First-page text patterns
                     try:
                         page = d[0]
-                        text = page.get_text()
-                        if isinstance(text, str):
-                            title_patterns = [
-                                r"^([A-Z][^.!?\n]{9,120})(?:[.!?]|$)",
-                                r"^(.+)\n={3,}",
-                                r"^(.+)\n-{3,}",
-                            ]
-                            lines = text.split("\n")
-                            for pattern in title_patterns:
-                                for line in lines[:3]:
-                                    candidate = line.strip()
-                                    if not candidate:
-                                        continue
-                                    match = re.search(pattern, candidate, re.MULTILINE)
-                                    if match:
-                                        found = match.group(1).strip()
-                                        if len(found) > 10:
-                                            return found
+                        text = self._get_top_page_text(page)
+                        title = self._title_from_page_text(text)
+                        if title:
+                            return title
                     except Exception:
                         # Ignore and try next candidate/fallback
                         pass
@@ -133,6 +262,31 @@ class PDFProcessor:
             pass
 
 
+        return self._title_from_stem(pdf_path)
+
+    @staticmethod
+    def _title_from_page_text(text) -> str | None:
+        """Find a plausible title in the first lines of page text"""
+        if not isinstance(text, str):
+            return None
+
+        # Iterate lines outermost: strip once per line, one union search,
+        # and return as soon as the first plausible line matches
+        for line in text.split("\n")[:3]:
+            candidate = line.strip()
+            if not candidate:
+                continue
+            match = _TITLE_RE.search(candidate)
+            if match:
+                found = (match.group(1) or match.group(2)).strip()
+                if len(found) > 10:
+                    return found
+
+        return None
+
+    @staticmethod
+    def _title_from_stem(pdf_path: Path) -> str | None:
+        """Derive a human-readable title from the filename stem"""
         # Robust stem extraction (handle mocks/non-Path inputs)
         try:
             stem_obj = getattr(pdf_path, "stem", None)
@@ -140,37 +294,101 @@ class PDFProcessor:
         except Exception:
             stem = ""
 
-        title = re.sub(r"([a-z])([A-Z])", r"\1 \2", stem)
-        title = re.sub(r"_+", " ", title)
+        title = _CAMEL_CASE_RE.sub(r"\1 \2", stem)
+        title = _UNDERSCORE_RE.sub(" ", title)
         title = title.replace("-", " ")
 
         return title.strip() if title.strip() else None
 
+    @staticmethod
+    def _open_doc(pdf_path: Path):
+        """
+        Open a PDF for parsing, reading the file into memory in one pass.
+        In-memory parsing avoids repeated filesystem seeks; falls back to
+        path-based open for non-file inputs (e.g. mocked paths in tests).
+        """
+        _load_fitz()
+        try:
+            data = Path(pdf_path).read_bytes()
+        except (OSError, TypeError, ValueError):
+            return fitz.open(pdf_path)
+        return fitz.open(stream=data, filetype="pdf")
+
+    @staticmethod
+    def _get_top_page_text(page) -> str | None:
+        """
+        Text of the top ~40% of a page via clipped block extraction.
+        Titles live at the top, so skipping the rest of the page avoids a full
+        character-positioning pass. Falls back to plain get_text() when block
+        extraction is unavailable (e.g. mocked pages in tests).
+        """
+        try:
+            clip = fitz.Rect(0, 0, page.rect.width, page.rect.height * 0.4)
+            blocks = page.get_text("blocks", clip=clip)
+        except Exception:
+            blocks = None
+
+        if isinstance(blocks, str):
+            # Mocked get_text ignores arguments and returns the page text
+            return blocks
+        if blocks:
+            # Only the first few blocks (sorted top-down) can hold the title
+            top_blocks = sorted(blocks, key=lambda b: b[1])[:3]
+            return "\n".join(b[4] for b in top_blocks if isinstance(b[4], str))
+
+        try:
+            return page.get_text()
+        except Exception:
+            return None
+
     def extract_metadata(self, pdf_path: Path) -> PDFMetadata:
+        """Extract metadata from PDF (memoized per file fingerprint)"""
+        key = self._file_fingerprint(pdf_path)
+        if key is not None and key in self._metadata_cache:
+            return self._metadata_cache[key]
+
+        metadata = self._extract_metadata_uncached(pdf_path)
+
+        if key is not None:
+            self._cache_store(self._metadata_cache, key, metadata)
+
+        return metadata
+
+    def _extract_metadata_uncached(self, pdf_path: Path) -> PDFMetadata:
         """Extract metadata from PDF - improved version"""
         metadata = PDFMetadata()
 
         try:
-            import fitz
-
-            with fitz.open(pdf_path) as doc:
+            with self._open_doc(pdf_path) as doc:
                 pdf_metadata = doc.metadata
 
-                # Extract basic metadata
-                metadata.title = pdf_metadata.get("title", "").strip() or self.extract_title(pdf_path)
                 metadata.year = self._extract_year_from_metadata(pdf_metadata)
 
+                # Extract page texts once and share them across all helpers
+                # (each get_text() call re-parses the page content stream).
+                # DOIs, abstracts and keywords sit on pages 1-2 of nearly all
+                # academic PDFs, so only those pages are ever parsed
+                page_texts = [doc[i].get_text() for i in range(min(2, len(doc)))]
+
+                # Title: doc metadata, then the already-extracted first-page
+                # text, then the filename - without reopening the PDF
+                metadata.title = (
+                    pdf_metadata.get("title", "").strip()
+                    or self._title_from_page_text(page_texts[0] if page_texts else None)
+                    or self._title_from_stem(pdf_path)
+                )
+
                 # Try to extract DOI
-                metadata.doi = self._extract_doi_from_pdf(doc)
+                metadata.doi = self._extract_doi_from_pdf(page_texts[:2])
 
                 # Try to extract abstract
-                metadata.abstract = self._extract_abstract_from_pdf(doc)
+                metadata.abstract = self._extract_abstract_from_pdf(page_texts[:1])
 
                 # Try to extract author information
-                metadata.authors = self._extract_authors_from_pdf(doc)
+                metadata.authors = self._extract_authors_from_pdf(page_texts[:1])
 
                 # Try to extract keywords
-                metadata.keywords = self._extract_keywords_from_pdf(doc)
+                metadata.keywords = self._extract_keywords_from_pdf(page_texts[:2])
 
         except Exception:
             pass
@@ -179,128 +397,85 @@ class PDFProcessor:
 
     def _extract_year_from_metadata(self, pdf_metadata: dict[str, Any]) -> int | None:
         """Extract year from metadata"""
-
-        date_fields = ["creationDate", "modDate", "producer"]
-
-        for field in date_fields:
-            value = pdf_metadata.get(field, "")
-            if value:
-
-                year_match = re.search(r"\b(19\d{2}|20\d{2})\b", str(value))
-                if year_match:
-                    return int(year_match.group(1))
-
-        return None
-
-    def _extract_doi_from_pdf(self, doc) -> str | None:
-        """Extract DOI from PDF"""
-        doi_pattern = r"\b10\.\d{4,9}/[-._;()/:A-Z0-9]+\b"
-
+        # Join the candidate fields once and run a single regex pass; the join
+        # order preserves the old per-field priority
+        blob = " ".join(
+            str(pdf_metadata.get(date_field, "") or "")
+            for date_field in ("creationDate", "modDate", "producer")
+        )
+
+        year_match = _META_YEAR_RE.search(blob)
+        return int(year_match.group(1)) if year_match else None
+
+    def _extract_doi_from_pdf(self, texts: list[str]) -> str | None:
+        """Extract DOI from pre-extracted page texts"""
         # Search for DOI on the first few pages
-        for page_num in range(min(5, len(doc))):
-            page = doc[page_num]
-            text = page.get_text()
-
-            match = re.search(doi_pattern, text, re.IGNORECASE)
+        for text in texts:
+            match = _search_head(_DOI_RE, text)
             if match:
                 return match.group(0).lower()
 
         return None
 
-    def _extract_abstract_from_pdf(self, doc) -> str | None:
-        """Extract abstract from PDF"""
+    def _extract_abstract_from_pdf(self, texts: list[str]) -> str | None:
+        """Extract abstract from pre-extracted page texts"""
 
-        if len(doc) > 0:
-            page = doc[0]
-            text = page.get_text()
-
-
-            abstract_patterns = [
-                r"Abstract\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+|\n\d+\.)",
-                r"ABSTRACT\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+|\n\d+\.)",
-                r"Summary\s*\n(.*?)(?:\n\n|\n[A-Z][a-z]+|\n\d+\.)",
-            ]
-
-            for pattern in abstract_patterns:
-                match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-                if match:
-                    abstract = match.group(1).strip()
-                    if len(abstract) > 50:
-                        return abstract
+        if texts:
+            match = _search_head(_ABSTRACT_RE, texts[0])
+            if match:
+                abstract = match.group(1).strip()
+                if len(abstract) > 50:
+                    return abstract
 
         return None
 
-    def _extract_authors_from_pdf(self, doc) -> list[str]:
-        """Extract author information from PDF"""
+    def _extract_authors_from_pdf(self, texts: list[str]) -> list[str]:
+        """Extract author information from pre-extracted page texts"""
         authors = []
 
         try:
             # Find author information on the first page
-            if len(doc) > 0:
-                page = doc[0]
-                text = page.get_text()
-
-                # Common author patterns
-                author_patterns = [
-                    r"Authors?:\s*([^\n]+)",
-                    r"By\s+([^\n]+)",
-                    r"Written by\s+([^\n]+)",
-                    r"^([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)*[A-Z][a-z]+(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z]\.?\s*)*[A-Z][a-z]+)*)\s*\n",
-                ]
-
-                for pattern in author_patterns:
-                    match = re.search(pattern, text, re.MULTILINE)
-                    if match:
-                        author_text = match.group(1).strip()
-                        # Separate authors separated by comma or "and"
-                        if "," in author_text:
-                            authors = [a.strip() for a in author_text.split(",") if a.strip()]
-                        elif " and " in author_text:
-                            authors = [a.strip() for a in author_text.split(" and ") if a.strip()]
-                        else:
-                            authors = [author_text]
-
-                        # Too many authors are excluded (not a paper)
-                        if len(authors) <= 10:
-                            break
+            if texts:
+                text = texts[0]
+
+                # One alternated pattern covers the labeled and name-list forms
+                match = _search_head(_AUTHOR_RE, text)
+                if match:
+                    author_text = (match.group(1) or match.group(2)).strip()
+                    # Separate authors separated by comma or "and"
+                    if "," in author_text:
+                        authors = [a.strip() for a in author_text.split(",") if a.strip()]
+                    elif " and " in author_text:
+                        authors = [a.strip() for a in author_text.split(" and ") if a.strip()]
+                    else:
+                        authors = [author_text]
+
+                    # Too many authors are excluded (not a paper)
+                    if len(authors) > 10:
+                        authors = []
 
         except Exception:
             pass
 
         return authors
 
-    def _extract_keywords_from_pdf(self, doc) -> list[str]:
-        """Extract keywords from PDF"""
+    def _extract_keywords_from_pdf(self, texts: list[str]) -> list[str]:
+        """Extract keywords from pre-extracted page texts"""
         keywords = []
 
         try:
 
-            for page_num in range(min(3, len(doc))):
-                page = doc[page_num]
-                text = page.get_text()
-
-
-                keyword_patterns = [
-                    r"Keywords?:\s*([^\n]+)",
-                    r"Key words?:\s*([^\n]+)",
-                    r"Subject classifications?:\s*([^\n]+)",
-                ]
-
-                for pattern in keyword_patterns:
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        keyword_text = match.group(1).strip()
-
-                        if "," in keyword_text:
-                            keywords = [k.strip() for k in keyword_text.split(",") if k.strip()]
-                        elif ";" in keyword_text:
-                            keywords = [k.strip() for k in keyword_text.split(";") if k.strip()]
-                        else:
-                            keywords = [keyword_text]
-
+            for text in texts:
+                match = _search_head(_KEYWORD_RE, text, head=4096)
+                if match:
+                    keyword_text = match.group(1).strip()
 
-                        if len(keywords) <= 20:
-                            break
+                    if "," in keyword_text:
+                        keywords = [k.strip() for k in keyword_text.split(",") if k.strip()]
+                    elif ";" in keyword_text:
+                        keywords = [k.strip() for k in keyword_text.split(";") if k.strip()]
+                    else:
+                        keywords = [keyword_text]
 
                 if keywords:
                     break
@@ -331,6 +506,13 @@ class PDFProcessor:
             # Fallback to basic text extraction without Docling
             return self._fallback_convert_to_markdown(pdf_path, output_dir, image_mode)
 
+        # Conversion is pure w.r.t. (pdf bytes, image_mode); a cache hit skips
+        # the multi-second Docling pipeline entirely on re-runs
+        cache_key = self._conversion_cache_key(pdf_path, image_mode)
+        cached = self._load_cached_conversion(cache_key, output_dir)
+        if cached is not None:
+            return cached
+
         try:
 
             result = self.docling_processor.convert(pdf_path)
@@ -351,12 +533,81 @@ class PDFProcessor:
             metadata = self.extract_metadata(pdf_path)
             markdown_text = self._add_metadata_frontmatter(markdown_text, metadata)
 
+            self._store_cached_conversion(cache_key, markdown_text, image_paths)
             return markdown_text, image_paths
 
         except Exception as e:
             msg = f"Failed to convert PDF {pdf_path}: {e}"
             raise RuntimeError(msg) from e
 
+    def _conversion_cache_key(self, pdf_path: Path, image_mode: str) -> str | None:
+        """Cache key for a conversion: content hash plus image mode"""
+        try:
+            return f"{get_file_hash(Path(pdf_path))}_{image_mode}"
+        except (OSError, TypeError, ValueError):
+            return None
+
+    def _load_cached_conversion(
+        self,
+        cache_key: str | None,
+        output_dir: Path
+    ) -> tuple[str, list[Path]] | None:
+        """Return a previously cached conversion, restoring images to output_dir"""
+        if cache_key is None:
+            return None
+
+        cache_dir = self.config.cache_dir / "conversions"
+        markdown_file = cache_dir / f"{cache_key}.md"
+        if not markdown_file.exists():
+            return None
+
+        try:
+            markdown_text = markdown_file.read_text(encoding="utf-8")
+
+            image_paths = []
+            images_dir = cache_dir / f"{cache_key}_images"
+            if images_dir.is_dir():
+                artifacts_dir = output_dir / self.config.artifacts_dir_name
+                ensure_directory(artifacts_dir)
+                for cached_image in sorted(images_dir.iterdir()):
+                    target = artifacts_dir / cached_image.name
+                    if not target.exists():
+                        shutil.copy2(cached_image, target)
+                    image_paths.append(target)
+
+            return markdown_text, image_paths
+        except OSError:
+            return None
+
+    def _store_cached_conversion(
+        self,
+        cache_key: str | None,
+        markdown_text: str,
+        image_paths: list[Path]
+    ) -> None:
+        """Persist a conversion result (best effort; failures are ignored)"""
+        if cache_key is None:
+            return
+
+        try:
+            cache_dir = self.config.cache_dir / "conversions"
+            ensure_directory(cache_dir)
+
+            # Atomic write so a crashed run never leaves a truncated entry
+            tmp_file = cache_dir / f".{cache_key}.md.tmp"
+            tmp_file.write_text(markdown_text, encoding="utf-8")
+            os.replace(tmp_file, cache_dir / f"{cache_key}.md")
+
+            if image_paths:
+                images_dir = cache_dir / f"{cache_key}_images"
+                ensure_directory(images_dir)
+                for image_path in image_paths:
+                    target = images_dir / Path(image_path).name
+                    if not target.exists():
+                        shutil.copy2(image_path, target)
+        except OSError:
+            pass  # Ignore cache save failure
+
     def _process_images_placeholder(
         self,
         docling_result,
@@ -367,20 +618,31 @@ class PDFProcessor:
         artifacts_dir = output_dir / self.config.artifacts_dir_name
         ensure_directory(artifacts_dir)
 
+        def save_image(data) -> Path:
+            # Create image filename based on hash; skip rewrite on dedup hit
+            image_hash = get_file_hash_from_bytes(data)
+            image_path = artifacts_dir / f"image_{image_hash}.png"
+            if not image_path.exists():
+                write_binary_file(image_path, data)
+            return image_path
+
         try:
-            # Extract and save images from Docling result
-            for item in docling_result.document.body.content:
-                if hasattr(item, "image") and item.image:
-                    # Create image filename based on hash
-                    image_hash = get_file_hash_from_bytes(item.image.get_image())
-                    image_filename = f"image_{image_hash}.png"
-                    image_path = artifacts_dir / image_filename
+            # Read each image's bytes once from the Docling result
+            image_datas = [
+                item.image.get_image()
+                for item in docling_result.document.body.content
+                if hasattr(item, "image") and item.image
+            ]
 
-                    # Save image
-                    with open(image_path, "wb") as f:
-                        f.write(item.image.get_image())
+            # Hash+write is independent per image; overlap the disk writes
+            # for image-heavy papers, avoiding pool overhead for small ones
+            if len(image_datas) > 4:
+                from concurrent.futures import ThreadPoolExecutor
 
-                    image_paths.append(image_path)
+                with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                    image_paths = list(executor.map(save_image, image_datas))
+            else:
+                image_paths = [save_image(data) for data in image_datas]
 
         except Exception:
             pass  # Ignore image processing failure
@@ -421,19 +683,13 @@ class PDFProcessor:
 
     def _clean_markdown_formatting(self, text: str) -> str:
         """Clean markdown formatting"""
-        # Clean consecutive empty lines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        return self._clean_markdown_content(text)
 
-        # Clean unnecessary spaces
-        lines = text.split("\n")
-        cleaned_lines = []
-
-        for line in lines:
-            # Remove trailing spaces
-            line = line.rstrip()
-            cleaned_lines.append(line)
-
-        return "\n".join(cleaned_lines)
+    def _clean_markdown_content(self, text: str) -> str:
+        """Clean converted markdown in a single regex pass"""
+        # Collapses separator runs, excess blank lines and trailing spaces in
+        # one scan; matters on multi-MB Docling outputs
+        return _MD_CLEAN_RE.sub(_md_clean_repl, text)
 
     def _add_metadata_frontmatter(
         self,
@@ -441,25 +697,79 @@ class PDFProcessor:
         metadata: PDFMetadata
     ) -> str:
         """Add YAML front matter"""
-        frontmatter_lines = ["---"]
-
-        if metadata.title:
-            frontmatter_lines.append(f'title: "{metadata.title}"')
-        if metadata.authors:
-            authors_str = ", ".join(f'"{author}"' for author in metadata.authors)
-            frontmatter_lines.append(f"authors: [{authors_str}]")
-        if metadata.year:
-            frontmatter_lines.append(f"year: {metadata.year}")
-        if metadata.doi:
-            frontmatter_lines.append(f'doi: "{metadata.doi}"')
-        if metadata.keywords:
-            keywords_str = ", ".join(f'"{kw}"' for kw in metadata.keywords)
-            frontmatter_lines.append(f"keywords: [{keywords_str}]")
-
-        frontmatter_lines.append("---")
-        frontmatter_lines.append("")
-
-        return "\n".join(frontmatter_lines) + markdown_text
+        # Data-driven rendering: (key, pre-rendered YAML value or None to skip)
+        fields = (
+            ("title", f'"{metadata.title}"' if metadata.title else None),
+            (
+                "authors",
+                "[" + ", ".join(f'"{author}"' for author in metadata.authors) + "]"
+                if metadata.authors else None,
+            ),
+            ("year", metadata.year),
+            ("doi", f'"{metadata.doi}"' if metadata.doi else None),
+            (
+                "keywords",
+                "[" + ", ".join(f'"{kw}"' for kw in metadata.keywords) + "]"
+                if metadata.keywords else None,
+            ),
+        )
+
+        body = "\n".join(f"{key}: {value}" for key, value in fields if value)
+        if body:
+            return f"---\n{body}\n---\n{markdown_text}"
+        return f"---\n---\n{markdown_text}"
+
+    def convert_to_markdown_stream(self, pdf_path: Path) -> Iterator[str]:
+        """
+        Yield Markdown chunks page by page via basic fitz text extraction.
+
+        Keeps memory bounded to one page at a time, which matters for
+        multi-hundred-page scanned PDFs where joining everything up front
+        would buffer the whole document.
+        """
+        if _load_fitz() is None:
+            msg = "PDF processing requires either Docling or PyMuPDF (fitz)"
+            raise RuntimeError(msg)
+
+        with fitz.open(pdf_path) as doc:
+            yield f"# {pdf_path.stem}\n\n"
+
+            # Extract text one page at a time
+            for page_num in range(len(doc)):
+                text = doc[page_num].get_text()
+                if text.strip():
+                    yield f"## Page {page_num + 1}\n\n{text.strip()}\n\n"
+
+    def convert_batch(
+        self,
+        pdf_paths: list[Path],
+        output_dir: Path,
+        image_mode: str = "placeholder"
+    ) -> list[tuple[str, list[Path]]]:
+        """
+        Convert multiple PDFs in parallel worker processes.
+
+        Each worker builds its own PDFProcessor once (amortizing the heavy
+        Docling converter construction across its files). Single-file input
+        and config.workers=1 stay in-process to avoid pool startup cost.
+        """
+        pdf_paths = list(pdf_paths)
+        workers = self.config.workers or os.cpu_count()
+        if len(pdf_paths) <= 1 or workers == 1:
+            return [
+                self.convert_to_markdown(pdf_path, output_dir, image_mode)
+                for pdf_path in pdf_paths
+            ]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        work_items = [(pdf_path, output_dir, image_mode) for pdf_path in pdf_paths]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self.config,),
+        ) as executor:
+            return list(executor.map(_convert_batch_item, work_items, chunksize=1))
 
     def _fallback_convert_to_markdown(
         self,
@@ -469,33 +779,53 @@ class PDFProcessor:
     ) -> tuple[str, list[Path]]:
         """
         Fallback PDF to Markdown conversion without Docling.
-        Uses basic text extraction with fitz.
+        Thin wrapper joining the page-streaming generator.
         """
         try:
-            import fitz
+            markdown_content = "".join(self.convert_to_markdown_stream(pdf_path))
 
-            with fitz.open(pdf_path) as doc:
-                markdown_content = f"# {pdf_path.stem}\n\n"
+            # For images, return empty list since we can't extract without Docling
+            return markdown_content, []
 
-                # Extract text from all pages
-                for page_num in range(len(doc)):
-                    page = doc[page_num]
-                    text = page.get_text()
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to convert PDF {pdf_path}: {e}") from e
 
-                    if text.strip():
-                        markdown_content += f"## Page {page_num + 1}\n\n{text.strip()}\n\n"
 
-                # For images, return empty list since we can't extract without Docling
-                image_paths = []
+# Per-process Docling converter singleton shared by all PDFProcessor instances
+_docling_converter = None
 
-                return markdown_content, image_paths
 
-        except ImportError:
-            raise RuntimeError("PDF processing requires either Docling or PyMuPDF (fitz)")
-        except Exception as e:
-            raise RuntimeError(f"Failed to convert PDF {pdf_path}: {e}") from e
+# Per-process worker state for convert_batch (a DocumentConverter cannot be
+# pickled, so each worker process constructs its own processor once)
+_batch_worker_processor: PDFProcessor | None = None
+
+
+def _init_batch_worker(config: Config) -> None:
+    global _batch_worker_processor
+    _batch_worker_processor = PDFProcessor(config)
+
+
+def _convert_batch_item(args: tuple[Path, Path, str]) -> tuple[str, list[Path]]:
+    pdf_path, output_dir, image_mode = args
+    return _batch_worker_processor.convert_to_markdown(pdf_path, output_dir, image_mode)
+
+
+# Prefer SIMD-accelerated non-cryptographic hashes when available; the value
+# is only a filename uniqueness token, so cryptographic strength is not needed
+try:
+    from blake3 import blake3 as _hash_bytes
+except ImportError:
+    try:
+        from xxhash import xxh3_64 as _hash_bytes
+    except ImportError:
+        def _hash_bytes(data: bytes):
+            # BLAKE2b with a 4-byte digest: ~3x MD5 throughput in CPython
+            # and exactly the 8 hex chars the callers keep
+            return hashlib.blake2b(data, digest_size=4)
 
 
 def get_file_hash_from_bytes(data: bytes) -> str:
-    """Calculate hash from byte data"""
-    return hashlib.md5(data).hexdigest()[:8]
+    """Calculate hash from byte data (not a cryptographic identity check)"""
+    return _hash_bytes(data).hexdigest()[:8]
@@ -2,24 +2,84 @@
 Common test fixtures and configurations for all tests
 """
 
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, Mock
 
 import pytest
+import requests
+from typer.testing import CliRunner
 
+from paperef.cli.main import app
 from paperef.core.pdf_processor import PDFMetadata
 from paperef.utils.config import Config
 
 
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory for tests"""
-    return Path(tempfile.mkdtemp())
-    # Cleanup is handled by pytest
+class FakePage:
+    """Minimal stand-in for a fitz page (plain attribute access, no Mock overhead)"""
 
+    def __init__(self, text: str):
+        self.text = text
 
-@pytest.fixture
+    def get_text(self, *args, **kwargs):
+        return self.text
+
+    def search_for(self, *args, **kwargs):
+        return []
+
+
+class FakeDoc:
+    """Minimal stand-in for a fitz document"""
+
+    def __init__(self, pages, metadata=None):
+        self._pages = list(pages)
+        self.metadata = metadata or {}
+
+    def __len__(self):
+        return len(self._pages)
+
+    def __getitem__(self, index):
+        return self._pages[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Create CLI runner (stateless, so one instance serves the whole session)
+
+    NO_COLOR/TERM=dumb turn off Rich's ANSI rendering and terminal probing,
+    which shaves a little off every invoke and keeps output assertions plain.
+    """
+    return CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
+
+
+@pytest.fixture(scope="session")
+def help_result(runner):
+    """Invoke `app --help` once per session; help rendering walks the whole
+    command tree, so the many substring tests share this single result"""
+    return runner.invoke(app, ["--help"])
+
+
+@pytest.fixture()
+def temp_dir(tmp_path):
+    """Per-test directory under pytest's session-scoped tmp root"""
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """Default Config shared by read-only tests (never mutated)"""
+    return Config()
+
+
+@pytest.fixture()
 def mock_config():
     """Create comprehensive mock configuration"""
     return Config(
@@ -38,7 +98,7 @@ def mock_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture()
 def mock_pdf_metadata():
     """Create mock PDF metadata"""
     return PDFMetadata(
@@ -51,18 +111,10 @@ def mock_pdf_metadata():
     )
 
 
-@pytest.fixture
+@pytest.fixture()
 def mock_fitz_document():
-    """Create comprehensive mock for PyMuPDF document"""
-    mock_doc = MagicMock()
-    mock_doc.metadata = {
-        "title": "Test Paper",
-        "creationDate": "2023-01-15"
-    }
-
-    # Mock page
-    mock_page = MagicMock()
-    mock_page.get_text.return_value = """
+    """Create lightweight fake for PyMuPDF document"""
+    page_text = """
     DOI: 10.1234/test-doi
 
     Abstract
@@ -71,16 +123,16 @@ def mock_fitz_document():
 
     Keywords: machine learning, testing
     """
-    mock_page.search_for.return_value = []
-
-    mock_doc.__len__.return_value = 1
-    mock_doc.__getitem__.return_value = mock_page
-    mock_doc.close = MagicMock()
-
-    return mock_doc
+    return FakeDoc(
+        pages=[FakePage(page_text)],
+        metadata={
+            "title": "Test Paper",
+            "creationDate": "2023-01-15"
+        },
+    )
 
 
-@pytest.fixture
+@pytest.fixture()
 def mock_docling_processor():
     """Create comprehensive mock for Docling processor"""
     mock_converter = MagicMock()
@@ -102,7 +154,7 @@ def mock_docling_processor():
     return mock_converter
 
 
-@pytest.fixture
+@pytest.fixture()
 def mock_path_obj():
     """Create mock Path object that supports operations"""
     mock_path = MagicMock(spec=Path)
@@ -117,10 +169,25 @@ def mock_path_obj():
     return mock_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def hash_fixture_files(tmp_path_factory):
+    """Write the file-hash test inputs once per session"""
+    directory = tmp_path_factory.mktemp("hash")
+    file_a = directory / "file_a.txt"
+    file_b = directory / "file_b.txt"
+    file_a.write_bytes(b"Hello, World! This is test content for hashing.")
+    file_b.write_bytes(b"Content 2")
+    return {"a": file_a, "b": file_b}
+
+
+# Shared spec target so every mock_session carries the real Session API
+_SESSION_SPEC = requests.Session
+
+
+@pytest.fixture()
 def mock_session():
     """Create mock requests session"""
-    mock_sess = MagicMock()
+    mock_sess = MagicMock(spec=_SESSION_SPEC)
 
     # Mock successful response
     mock_response = MagicMock()
@@ -147,42 +214,53 @@ def mock_session():
     return mock_sess
 
 
-@pytest.fixture
-def sample_bibtex():
-    """Sample BibTeX content for testing"""
-    return """@article{test2023,
+# Read-only BibTeX literals; the session-scoped fixtures below hand out the
+# same immutable string instead of re-running fixture setup per test
+_SAMPLE_BIBTEX = """@article{test2023,
   title={Test Paper},
   author={Doe, John},
   year={2023}
 }"""
 
-
-@pytest.fixture
-def sample_bibtex_with_doi():
-    """Sample BibTeX with DOI"""
-    return """@article{test2023,
+_SAMPLE_BIBTEX_WITH_DOI = """@article{test2023,
   title={Test Paper},
   author={Doe, John},
   year={2023},
   doi={10.1145/example.doi}
 }"""
 
-
-@pytest.fixture
-def sample_bibtex_acm_pages():
-    """Sample BibTeX with ACM-style pages"""
-    return """@inproceedings{test2023,
+_SAMPLE_BIBTEX_ACM_PAGES = """@inproceedings{test2023,
   title={Test Paper},
   author={Doe, John},
   pages={138:1--138:12}
 }"""
 
-
-@pytest.fixture
-def sample_bibtex_with_special_chars():
-    """Sample BibTeX with special characters"""
-    return """@article{test2023,
+_SAMPLE_BIBTEX_SPECIAL_CHARS = """@article{test2023,
   title={Paper & More},
   abstract={Some text with 100% success}
 }"""
 
+
+@pytest.fixture(scope="session")
+def sample_bibtex():
+    """Sample BibTeX content for testing"""
+    return _SAMPLE_BIBTEX
+
+
+@pytest.fixture(scope="session")
+def sample_bibtex_with_doi():
+    """Sample BibTeX with DOI"""
+    return _SAMPLE_BIBTEX_WITH_DOI
+
+
+@pytest.fixture(scope="session")
+def sample_bibtex_acm_pages():
+    """Sample BibTeX with ACM-style pages"""
+    return _SAMPLE_BIBTEX_ACM_PAGES
+
+
+@pytest.fixture(scope="session")
+def sample_bibtex_with_special_chars():
+    """Sample BibTeX with special characters"""
+    return _SAMPLE_BIBTEX_SPECIAL_CHARS
+
@@ -3,9 +3,7 @@ Test CacheManager - TDD approach
 Tests for intelligent caching system with TTL and size management
 """
 
-import tempfile
 import time
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -16,13 +14,12 @@ from paperef.core.cache_manager import CacheEntry, CacheManager
 class TestCacheManager:
     """Test cases for CacheManager class"""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            yield Path(tmp_dir)
+    @pytest.fixture()
+    def temp_dir(self, tmp_path):
+        """Per-test directory under pytest's session-scoped tmp root"""
+        return tmp_path
 
-    @pytest.fixture
+    @pytest.fixture()
     def cache_manager(self, temp_dir):
         """Create CacheManager instance"""
         cache_file = temp_dir / "test_cache.json"
@@ -51,6 +48,7 @@ class TestCacheManager:
         result = cache_manager.get("nonexistent_key")
         assert result is None
 
+    @pytest.mark.slow()
     def test_set_with_ttl(self, cache_manager):
         """Test setting a value with TTL"""
         # Set with short TTL
@@ -65,6 +63,7 @@ class TestCacheManager:
         # Should be expired
         assert cache_manager.get("short_ttl_key") is None
 
+    @pytest.mark.slow()
     def test_set_with_custom_ttl(self, cache_manager):
         """Test setting values with different TTLs"""
         # Set multiple values with different TTLs
@@ -149,6 +148,7 @@ class TestCacheManager:
         # Should be able to retrieve persisted value
         assert manager2.get("persistent_key") == "persistent_value"
 
+    @pytest.mark.slow()
     def test_cleanup_expired(self, cache_manager):
         """Test manual cleanup of expired entries"""
         # Set values with different TTLs
@@ -184,6 +184,7 @@ class TestCacheManager:
         cache_manager.set("none_key", None)
         assert cache_manager.get("none_key") is None
 
+    @pytest.mark.slow()
     def test_key_collision_with_ttl(self, cache_manager):
         """Test overwriting keys with different TTLs"""
         # Set initial value
@@ -283,6 +284,7 @@ class TestCacheEntry:
         assert entry.created_at is not None
         assert isinstance(entry.created_at, float)
 
+    @pytest.mark.slow()
     def test_cache_entry_expiration(self):
         """Test CacheEntry expiration"""
         # Create entry with 1 second TTL
@@ -332,4 +334,7 @@ class TestCacheEntry:
 
         assert entry.value == "test_value"
         assert entry.ttl == 3600
-        assert entry.created_at == data["created_at"]
+        # created_at is rebased onto the monotonic clock; the round trip
+        # must preserve the entry's age (freshly created -> not expired)
+        assert entry.created_at == pytest.approx(time.monotonic(), abs=1.0)
+        assert not entry.is_expired()
@@ -2,34 +2,15 @@
 Test suite for CLI functionality
 """
 
-import shutil
-import tempfile
-from pathlib import Path
-
 import pytest
-from typer.testing import CliRunner
 
-from paperef.cli.main import app
+from paperef.cli.main import app, validate_input_files
 from paperef.utils.config import Config
 
 
-@pytest.fixture
-def runner():
-    """Create CLI runner"""
-    return CliRunner()
-
-
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory for tests"""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
-    """Create mock configuration"""
+    """Create mock configuration (read-only, so shared across the session)"""
     return Config(
         output_dir="./test_output",
         image_mode="placeholder",
@@ -49,72 +30,51 @@ def mock_config():
 class TestCLI:
     """Test CLI commands"""
 
-    def test_cli_help(self, runner):
-        """Test CLI help command"""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "PDF to Markdown converter" in result.stdout
-        assert "process" in result.stdout
-
-    def test_cli_help(self, runner):
-        """Test CLI help"""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "PDF to Markdown converter" in result.stdout
-        assert "--output-dir" in result.stdout
-        assert "--image-mode" in result.stdout
-        assert "--bibtex-only" in result.stdout
+    def test_cli_help(self, help_result):
+        """Test CLI help command succeeds"""
+        assert help_result.exit_code == 0
+
+    @pytest.mark.parametrize("needle", [
+        "PDF to Markdown converter",
+        "process",
+        "--output-dir",
+        "--image-mode",
+        "--bibtex-only",
+        "--verbose",
+        "placeholder",
+        "image-mode",
+    ])
+    def test_help_contains(self, help_result, needle):
+        """Test that help output mentions each command and option"""
+        assert needle in help_result.stdout
 
     def test_cli_no_files(self, runner):
         """Test CLI with no input files"""
-        result = runner.invoke(app, [])
+        result = runner.invoke(app, [], catch_exceptions=False)
         # Should show help when no files provided
         assert result.exit_code == 0
         assert "PDF to Markdown converter" in result.stdout
 
-    def test_cli_nonexistent_file(self, runner, temp_dir):
-        """Test CLI with non-existent file"""
-        nonexistent_file = temp_dir / "nonexistent.pdf"
+    def test_cli_nonexistent_file(self, runner, tmp_path):
+        """Test CLI with non-existent file (click-wiring smoke test)"""
+        nonexistent_file = tmp_path / "nonexistent.pdf"
+        # keep catch_exceptions=True: the error path is reported via exit code
         result = runner.invoke(app, [str(nonexistent_file)])
 
         # Should fail with error message
         assert result.exit_code == 1
         assert "Error" in result.stdout
 
-    def test_cli_invalid_file_type(self, runner, temp_dir):
-        """Test CLI with invalid file type"""
-        invalid_file = temp_dir / "test.txt"
-        invalid_file.write_text("Not a PDF")
-
-        result = runner.invoke(app, [str(invalid_file)])
-        # Should fail with error message
-        assert result.exit_code == 1
-        assert "Error" in result.stdout
-
-    def test_cli_with_custom_options(self, runner):
-        """Test CLI with custom options - just test option parsing"""
-        result = runner.invoke(app, ["--help"])
-
-        # Just verify that help works with all our options
-        assert result.exit_code == 0
-        assert "--output-dir" in result.stdout
-        assert "--image-mode" in result.stdout
-        assert "--bibtex-only" in result.stdout
+    def test_cli_invalid_file_type(self, tmp_path, capsys):
+        """Test that non-PDF input is rejected (in-process, no CLI harness)"""
+        # Rejection is extension-based, so an empty file is enough
+        invalid_file = tmp_path / "test.txt"
+        invalid_file.touch()
 
+        valid_files = validate_input_files([invalid_file])
 
-class TestCLIOptions:
-    """Test CLI option parsing and validation"""
+        assert valid_files == []
+        captured = capsys.readouterr()
+        assert "not a valid PDF file" in captured.out
+        assert "Error" in captured.out
 
-    def test_image_mode_help(self, runner):
-        """Test that image mode option is shown in help"""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "image-mode" in result.stdout
-        assert "placeholder" in result.stdout
-
-    def test_boolean_flags_help(self, runner):
-        """Test that boolean flags are shown in help"""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "--bibtex-only" in result.stdout
-        assert "--verbose" in result.stdout
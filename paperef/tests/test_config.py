@@ -12,9 +12,9 @@ from paperef.utils.config import Config
 class TestConfig:
     """Test Config class"""
 
-    def test_config_initialization_default(self):
+    def test_config_initialization_default(self, default_config):
         """Test Config initialization with default values"""
-        config = Config()
+        config = default_config
 
         assert config.output_dir == Path("./papers")
         assert config.image_mode == "placeholder"
@@ -3,100 +3,137 @@ Test DOIEnricher - TDD approach
 Tests for DOI enrichment system and BibTeX field optimization
 """
 
+import re
 from unittest.mock import Mock, patch
 
 import pytest
 
 from paperef.core.doi_enricher import BibTeXFieldOptimizer, DOIEnricher
 
+# Compiled `key = {value}` patterns, keyed by (key, value); one regex search
+# replaces the old dual "key = {v}" / "key={v}" substring scans
+_FIELD_RE_CACHE = {}
 
-class TestDOIEnricher:
-    """Test cases for DOIEnricher class"""
 
-    @pytest.fixture
-    def doi_enricher(self):
-        """Create DOIEnricher instance"""
-        return DOIEnricher()
+def _has_field(result, key, value):
+    """Check for a BibTeX field in either `key = {v}` or `key={v}` style"""
+    pattern = _FIELD_RE_CACHE.setdefault(
+        (key, value),
+        re.compile(rf"{re.escape(key)}\s*=\s*\{{{re.escape(value)}\}}"),
+    )
+    return pattern.search(result) is not None
 
-    def test_init(self, doi_enricher):
-        """Test DOIEnricher initialization"""
-        assert doi_enricher is not None
-        assert hasattr(doi_enricher, "enrich_bibtex")
-        assert hasattr(doi_enricher, "search_doi")
-        assert hasattr(doi_enricher, "update_publisher_address")
-
-    def test_search_doi_by_title_success(self, doi_enricher):
-        """Test DOI search by title - successful case"""
-        # Mock the API response
-        mock_response = {
-            "message": {
-                "items": [
-                    {
-                        "DOI": "10.1145/example.doi",
-                        "title": ["Test Paper Title"],
-                        "author": [{"given": "John", "family": "Doe"}],
-                        "published-print": {"date-parts": [[2023]]},
-                        "publisher": "ACM",
-                        "container-title": ["CHI Conference"]
-                    }
-                ]
-            }
-        }
+class _Resp:
+    """Minimal stand-in for a requests.Response (no Mock machinery)"""
 
-        with patch.object(doi_enricher.session, "get") as mock_get:
-            mock_resp = Mock()
-            mock_resp.json.return_value = mock_response
-            mock_resp.raise_for_status.return_value = None
-            mock_get.return_value = mock_resp
+    __slots__ = ("_json",)
 
-            result = doi_enricher.search_doi("Test Paper Title", ["John Doe"], 2023)
+    def __init__(self, json_data):
+        self._json = json_data
 
-            assert result == "10.1145/example.doi"
-            mock_get.assert_called()
+    def json(self):
+        return self._json
 
-    def test_search_doi_by_title_no_results(self, doi_enricher):
-        """Test DOI search by title - no results"""
-        with patch("requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {"message": []}
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+    def raise_for_status(self):
+        pass
 
-            result = doi_enricher.search_doi("Nonexistent Paper", [], None)
 
-            assert result is None
-
-    def test_search_doi_by_title_api_error(self, doi_enricher, mock_session):
-        """Test DOI search by title - API error"""
-        doi_enricher.session = mock_session
-
-        # Mock API error
-        mock_session.get.side_effect = Exception("API Error")
+# Canonical Crossref search payload shared by the search_doi parametrization
+_CROSSREF_SEARCH_RESPONSE = {
+    "message": {
+        "items": [
+            {
+                "DOI": "10.1145/example.doi",
+                "title": ["Test Paper Title"],
+                "author": [{"given": "John", "family": "Doe"}],
+                "published-print": {"date-parts": [[2023]]},
+                "publisher": "ACM",
+                "container-title": ["CHI Conference"]
+            }
+        ]
+    }
+}
 
-        result = doi_enricher.search_doi("Test Paper", [], None)
 
-        assert result is None
+class TestDOIEnricher:
+    """Test cases for DOIEnricher class"""
 
-    def test_search_doi_by_doi_direct(self, doi_enricher):
-        """Test DOI search by existing DOI"""
-        doi = "10.1145/example.doi"
+    @pytest.fixture(scope="class")
+    def doi_enricher(self):
+        """One DOIEnricher per class: constructing it builds a requests.Session
+        (adapter mounting, pool manager), and tests stub all network access"""
+        return DOIEnricher()
 
-        with patch("requests.get") as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = {
-                "message": {
-                    "DOI": doi,
-                    "title": ["Test Paper"],
-                    "publisher": "ACM"
-                }
-            }
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+    @pytest.fixture(autouse=True)
+    def _patched_get(self, doi_enricher, monkeypatch):
+        """Patch HTTP GET once per test; tests wire .return_value/.side_effect.
 
-            result = doi_enricher.search_doi("Test Paper", [], None, existing_doi=doi)
+        monkeypatch installs/restores cheaper than per-test `with patch(...)`
+        contexts, and covering both requests.get and the enricher's session
+        keeps every test offline regardless of which path the code takes.
+        """
+        mock_get = Mock()
+        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr(doi_enricher.session, "get", mock_get)
+        return mock_get
 
-            assert result == doi
+    def test_init(self, doi_enricher):
+        """Test DOIEnricher initialization"""
+        assert doi_enricher is not None
+        assert hasattr(doi_enricher, "enrich_bibtex")
+        assert hasattr(doi_enricher, "search_doi")
+        assert hasattr(doi_enricher, "update_publisher_address")
 
+    @pytest.mark.parametrize(
+        ("mock_json", "mock_exc", "kwargs", "expected"),
+        [
+            pytest.param(
+                _CROSSREF_SEARCH_RESPONSE,
+                None,
+                {"title": "Test Paper Title", "authors": ["John Doe"], "year": 2023},
+                "10.1145/example.doi",
+                id="by_title_success",
+            ),
+            pytest.param(
+                {"message": []},
+                None,
+                {"title": "Nonexistent Paper", "authors": [], "year": None},
+                None,
+                id="by_title_no_results",
+            ),
+            pytest.param(
+                None,
+                Exception("API Error"),
+                {"title": "Test Paper", "authors": [], "year": None},
+                None,
+                id="by_title_api_error",
+            ),
+            pytest.param(
+                {"message": {"DOI": "10.1145/example.doi", "title": ["Test Paper"], "publisher": "ACM"}},
+                None,
+                {
+                    "title": "Test Paper",
+                    "authors": [],
+                    "year": None,
+                    "existing_doi": "10.1145/example.doi",
+                },
+                "10.1145/example.doi",
+                id="by_doi_direct",
+            ),
+        ],
+    )
+    def test_search_doi(self, doi_enricher, _patched_get, mock_json, mock_exc, kwargs, expected):
+        """Test DOI search across success, empty, error and direct-DOI paths"""
+        if mock_exc is not None:
+            _patched_get.side_effect = mock_exc
+        else:
+            _patched_get.return_value = _Resp(mock_json)
+
+        result = doi_enricher.search_doi(**kwargs)
+
+        assert result == expected
+
+    @pytest.mark.slow()
     def test_enrich_bibtex_with_doi(self, doi_enricher):
         """Test BibTeX enrichment with DOI"""
         bibtex_input = """@article{test2023,
@@ -128,15 +165,12 @@ class TestDOIEnricher:
                 result = doi_enricher.enrich_bibtex(bibtex_input)
 
                 # Check for enriched fields (allowing both formats)
-                assert ("doi = {10.1145/example.doi}" in result or
-                        "doi={10.1145/example.doi}" in result)
-                assert ("publisher = {ACM}" in result or
-                        "publisher={ACM}" in result)
-                assert ("journal = {CHI Conference}" in result or
-                        "journal={CHI Conference}" in result)
-                assert ("volume = {25}" in result or
-                        "volume={25}" in result)
+                assert _has_field(result, "doi", "10.1145/example.doi")
+                assert _has_field(result, "publisher", "ACM")
+                assert _has_field(result, "journal", "CHI Conference")
+                assert _has_field(result, "volume", "25")
 
+    @pytest.mark.slow()
     def test_enrich_bibtex_no_doi_found(self, doi_enricher):
         """Test BibTeX enrichment when no DOI is found"""
         bibtex_input = """@article{test2023,
@@ -193,8 +227,8 @@ class TestDOIEnricher:
         result = doi_enricher._normalize_acm_pages(sample_bibtex_acm_pages)
 
         # Check for normalized fields (allowing both formats)
-        assert ("articleno = {138}" in result or "articleno={138}" in result)
-        assert ("numpages = {12}" in result or "numpages={12}" in result)
+        assert _has_field(result, "articleno", "138")
+        assert _has_field(result, "numpages", "12")
         assert "pages=" not in result
 
     def test_normalize_regular_pages(self, doi_enricher):
@@ -207,7 +241,7 @@ class TestDOIEnricher:
         result = doi_enricher._normalize_acm_pages(bibtex_input)
 
         # Should preserve regular pages format
-        assert ("pages = {100-110}" in result or "pages={100-110}" in result)
+        assert _has_field(result, "pages", "100-110")
         assert "articleno=" not in result
         assert "numpages=" not in result
 
@@ -215,7 +249,7 @@ class TestDOIEnricher:
 class TestBibTeXFieldOptimizer:
     """Test cases for BibTeXFieldOptimizer class"""
 
-    @pytest.fixture
+    @pytest.fixture()
     def optimizer(self):
         """Create BibTeXFieldOptimizer instance"""
         return BibTeXFieldOptimizer()
@@ -238,10 +272,10 @@ class TestBibTeXFieldOptimizer:
         result = optimizer.clean_empty_fields(bibtex_input)
 
         # Should keep all fields in proper format
-        assert "title = {Test Paper}" in result or "title={Test Paper}" in result
-        assert "author = {Doe, John}" in result or "author={Doe, John}" in result
-        assert "note = {Some note}" in result or "note={Some note}" in result
-        assert "year = {2023}" in result or "year={2023}" in result
+        assert _has_field(result, "title", "Test Paper")
+        assert _has_field(result, "author", "Doe, John")
+        assert _has_field(result, "note", "Some note")
+        assert _has_field(result, "year", "2023")
 
     def test_optimize_entry_fields(self, optimizer):
         """Test field optimization for better BibTeX format"""
@@ -258,7 +292,7 @@ class TestBibTeXFieldOptimizer:
         # Should maintain proper BibTeX format
         assert "@article{test2023," in result
         assert "}" in result
-        assert "title = {Test Paper}" in result or "title={Test Paper}" in result
+        assert _has_field(result, "title", "Test Paper")
 
     def test_optimize_entry_with_missing_fields(self, optimizer, sample_bibtex):
         """Test optimization of BibTeX with missing required fields"""
@@ -266,7 +300,7 @@ class TestBibTeXFieldOptimizer:
 
         # Should identify and potentially add missing fields
         assert "@article{test2023," in result
-        assert ("title = {Test Paper}" in result or "title={Test Paper}" in result)
+        assert _has_field(result, "title", "Test Paper")
 
     def test_validate_bibtex_format(self, optimizer):
         """Test BibTeX format validation"""
@@ -290,6 +324,5 @@ class TestBibTeXFieldOptimizer:
         result = optimizer.optimize_entry(sample_bibtex_with_special_chars)
 
         # Should escape special characters
-        assert ("title = {Paper \\& More}" in result or "title={Paper \\& More}" in result)
-        assert ("abstract = {Some text with 100\\% success}" in result or
-                "abstract={Some text with 100\\% success}" in result)
+        assert _has_field(result, "title", "Paper \\& More")
+        assert _has_field(result, "abstract", "Some text with 100\\% success")
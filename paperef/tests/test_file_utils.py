@@ -2,9 +2,8 @@
 Test suite for file utility functions
 """
 
+import io
 import json
-import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -22,36 +21,28 @@ from paperef.utils.file_utils import (
 )
 
 
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory for tests"""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
-
-
 class TestDirectoryOperations:
     """Test directory operations"""
 
-    def test_ensure_directory(self, temp_dir):
+    def test_ensure_directory(self, tmp_path):
         """Test directory creation"""
-        test_dir = temp_dir / "test_subdir" / "nested"
+        test_dir = tmp_path / "test_subdir" / "nested"
         ensure_directory(test_dir)
         assert test_dir.exists()
         assert test_dir.is_dir()
 
-    def test_ensure_directory_existing(self, temp_dir):
+    def test_ensure_directory_existing(self, tmp_path):
         """Test directory creation when already exists"""
-        ensure_directory(temp_dir)
-        assert temp_dir.exists()
+        ensure_directory(tmp_path)
+        assert tmp_path.exists()
 
 
 class TestCacheOperations:
     """Test cache operations"""
 
-    def test_load_cache_file_exists(self, temp_dir):
+    def test_load_cache_file_exists(self, tmp_path):
         """Test loading cache from existing file"""
-        cache_file = temp_dir / "test_cache.json"
+        cache_file = tmp_path / "test_cache.json"
         test_data = {"key1": "value1", "key2": {"nested": "data"}}
 
         with cache_file.open("w", encoding="utf-8") as f:
@@ -60,23 +51,27 @@ class TestCacheOperations:
         result = load_cache(cache_file)
         assert result == test_data
 
-    def test_load_cache_file_not_exists(self, temp_dir):
+    def test_load_cache_file_not_exists(self, tmp_path):
         """Test loading cache from non-existing file"""
-        cache_file = temp_dir / "nonexistent_cache.json"
+        cache_file = tmp_path / "nonexistent_cache.json"
         result = load_cache(cache_file)
         assert result == {}
 
-    def test_load_cache_invalid_json(self, temp_dir):
-        """Test loading cache with invalid JSON"""
-        cache_file = temp_dir / "invalid_cache.json"
-        cache_file.write_text("invalid json content")
+    def test_load_cache_invalid_json(self, monkeypatch):
+        """Test loading cache with invalid JSON (in-memory, no disk I/O)"""
+        # Only the parser path is under test, so feed it a StringIO
+        # instead of writing a corrupt file to disk
+        monkeypatch.setattr(Path, "exists", lambda self: True)
+        monkeypatch.setattr(
+            Path, "open", lambda self, *args, **kwargs: io.StringIO("invalid json content")
+        )
 
-        result = load_cache(cache_file)
+        result = load_cache(Path("invalid_cache.json"))
         assert result == {}
 
-    def test_save_cache(self, temp_dir):
+    def test_save_cache(self, tmp_path):
         """Test saving cache to file"""
-        cache_file = temp_dir / "test_cache.json"
+        cache_file = tmp_path / "test_cache.json"
         test_data = {"key1": "value1", "key2": 42}
 
         save_cache(cache_file, test_data)
@@ -91,29 +86,19 @@ class TestCacheOperations:
 class TestFileHash:
     """Test file hashing"""
 
-    def test_get_file_hash(self, temp_dir):
+    def test_get_file_hash(self, hash_fixture_files):
         """Test file hash calculation"""
-        test_file = temp_dir / "test.txt"
-        test_content = b"Hello, World! This is test content for hashing."
-        test_file.write_bytes(test_content)
-
-        hash1 = get_file_hash(test_file)
-        hash2 = get_file_hash(test_file)
+        hash1 = get_file_hash(hash_fixture_files["a"])
+        hash2 = get_file_hash(hash_fixture_files["a"])
 
         # Same file should produce same hash
         assert hash1 == hash2
         assert len(hash1) == 8  # SHA256 truncated to 8 chars
 
-    def test_get_file_hash_different_content(self, temp_dir):
+    def test_get_file_hash_different_content(self, hash_fixture_files):
         """Test different files produce different hashes"""
-        file1 = temp_dir / "file1.txt"
-        file2 = temp_dir / "file2.txt"
-
-        file1.write_bytes(b"Content 1")
-        file2.write_bytes(b"Content 2")
-
-        hash1 = get_file_hash(file1)
-        hash2 = get_file_hash(file2)
+        hash1 = get_file_hash(hash_fixture_files["a"])
+        hash2 = get_file_hash(hash_fixture_files["b"])
 
         assert hash1 != hash2
 
@@ -136,17 +121,17 @@ class TestFilenameOperations:
         """Test filename sanitization with empty string"""
         assert sanitize_filename("") == "unnamed"
 
-    def test_get_unique_filename_no_conflict(self, temp_dir):
+    def test_get_unique_filename_no_conflict(self, tmp_path):
         """Test unique filename when no conflict exists"""
-        directory = temp_dir / "test_dir"
+        directory = tmp_path / "test_dir"
         directory.mkdir()
 
         filename = get_unique_filename(directory, "test", ".txt")
         assert filename == "test.txt"
 
-    def test_get_unique_filename_with_conflict(self, temp_dir):
+    def test_get_unique_filename_with_conflict(self, tmp_path):
         """Test unique filename when conflict exists"""
-        directory = temp_dir / "test_dir"
+        directory = tmp_path / "test_dir"
         directory.mkdir()
 
         # Create existing file
@@ -156,9 +141,9 @@ class TestFilenameOperations:
         filename = get_unique_filename(directory, "test", ".txt")
         assert filename == "test_1.txt"
 
-    def test_get_unique_filename_multiple_conflicts(self, temp_dir):
+    def test_get_unique_filename_multiple_conflicts(self, tmp_path):
         """Test unique filename with multiple conflicts"""
-        directory = temp_dir / "test_dir"
+        directory = tmp_path / "test_dir"
         directory.mkdir()
 
         # Create multiple existing files
@@ -173,86 +158,47 @@ class TestFilenameOperations:
 class TestFileReadWrite:
     """Test file read/write operations"""
 
-    def test_read_text_file_exists(self, temp_dir):
-        """Test reading existing text file"""
-        test_file = temp_dir / "test.txt"
-        test_content = "Hello, World!\nThis is a test file."
-        test_file.write_text(test_content, encoding="utf-8")
+    @pytest.mark.parametrize("subpath", ["test.txt", "subdir/nested/test.txt"])
+    def test_write_read_copy_roundtrip(self, tmp_path, subpath):
+        """Test write, read-back and copy in one cycle (flat and nested paths)"""
+        test_file = tmp_path / subpath
+        test_content = "Hello, World!\nThis is test content."
+
+        # Write (creates parent directories as needed)
+        assert write_text_file(test_file, test_content) is True
+        assert test_file.exists()
 
-        result = read_text_file(test_file)
-        assert result == test_content
+        # Read back
+        assert read_text_file(test_file) == test_content
 
-    def test_read_text_file_not_exists(self, temp_dir):
+        # Copy into a directory that does not exist yet
+        copy_target = tmp_path / "copies" / subpath
+        assert copy_file(test_file, copy_target) is True
+        assert copy_target.read_text(encoding="utf-8") == test_content
+
+    def test_read_text_file_not_exists(self, tmp_path):
         """Test reading non-existing file"""
-        nonexistent_file = temp_dir / "nonexistent.txt"
+        nonexistent_file = tmp_path / "nonexistent.txt"
         result = read_text_file(nonexistent_file)
         assert result is None
 
-    def test_read_text_file_encoding_error(self, temp_dir):
+    def test_read_text_file_encoding_error(self, tmp_path):
         """Test reading file with encoding error"""
-        test_file = temp_dir / "test.txt"
+        test_file = tmp_path / "test.txt"
         # Write some binary data that can't be decoded as UTF-8
         test_file.write_bytes(b"\xff\xfe\xfd")
 
         result = read_text_file(test_file, encoding="utf-8")
         assert result is None
 
-    def test_write_text_file(self, temp_dir):
-        """Test writing text file"""
-        test_file = temp_dir / "test.txt"
-        test_content = "Hello, World!\nThis is test content."
-
-        success = write_text_file(test_file, test_content)
-        assert success is True
-        assert test_file.exists()
-        assert test_file.read_text(encoding="utf-8") == test_content
-
-    def test_write_text_file_creates_directory(self, temp_dir):
-        """Test writing text file creates parent directory"""
-        test_file = temp_dir / "subdir" / "nested" / "test.txt"
-        test_content = "Test content"
-
-        success = write_text_file(test_file, test_content)
-        assert success is True
-        assert test_file.exists()
-        assert test_file.parent.exists()
-        assert test_file.read_text(encoding="utf-8") == test_content
-
 
 class TestFileCopy:
     """Test file copy operations"""
 
-    def test_copy_file_success(self, temp_dir):
-        """Test successful file copy"""
-        src_file = temp_dir / "source.txt"
-        dst_file = temp_dir / "destination.txt"
-
-        test_content = "Test content for copying"
-        src_file.write_text(test_content, encoding="utf-8")
-
-        success = copy_file(src_file, dst_file)
-        assert success is True
-        assert dst_file.exists()
-        assert dst_file.read_text(encoding="utf-8") == test_content
-
-    def test_copy_file_creates_directory(self, temp_dir):
-        """Test file copy creates destination directory"""
-        src_file = temp_dir / "source.txt"
-        dst_file = temp_dir / "subdir" / "destination.txt"
-
-        test_content = "Test content for copying"
-        src_file.write_text(test_content, encoding="utf-8")
-
-        success = copy_file(src_file, dst_file)
-        assert success is True
-        assert dst_file.exists()
-        assert dst_file.parent.exists()
-        assert dst_file.read_text(encoding="utf-8") == test_content
-
-    def test_copy_file_nonexistent_source(self, temp_dir):
+    def test_copy_file_nonexistent_source(self, tmp_path):
         """Test copying non-existing source file"""
-        nonexistent_src = temp_dir / "nonexistent.txt"
-        dst_file = temp_dir / "destination.txt"
+        nonexistent_src = tmp_path / "nonexistent.txt"
+        dst_file = tmp_path / "destination.txt"
 
         success = copy_file(nonexistent_src, dst_file)
         assert success is False
@@ -3,8 +3,6 @@ Test FolderManager - TDD approach
 Tests for PDF title-based automatic folder creation system
 """
 
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -15,15 +13,21 @@ from paperef.core.folder_manager import FolderManager
 class TestFolderManager:
     """Test cases for FolderManager class"""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            yield Path(tmp_dir)
+    @pytest.fixture(scope="class")
+    def _class_tmp(self, tmp_path_factory):
+        """One temp root per class instead of mkdtemp+rmtree per test"""
+        return tmp_path_factory.mktemp("fm")
 
-    @pytest.fixture
+    @pytest.fixture()
+    def temp_dir(self, _class_tmp, request):
+        """Per-test subdirectory of the class-scoped temp root"""
+        test_dir = _class_tmp / request.node.name
+        test_dir.mkdir()
+        return test_dir
+
+    @pytest.fixture(scope="class")
     def folder_manager(self):
-        """Create FolderManager instance"""
+        """Create FolderManager instance (stateless, safe to share)"""
         return FolderManager()
 
     def test_create_paper_folder_normal_title(self, folder_manager, temp_dir):
@@ -24,11 +24,17 @@ Notes:
 """
 
 import argparse
+import functools
+import hashlib
+import json
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from difflib import SequenceMatcher
+from pathlib import Path
 from typing import Any
 
 import bibtexparser
@@ -36,6 +42,8 @@ import requests
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.bwriter import BibTexWriter
 
+from paperef.utils.file_utils import load_cache, save_cache
+
 try:
     from rich.console import Console
     from rich.prompt import Confirm, Prompt
@@ -56,6 +64,70 @@ CROSSREF_BASE = "https://api.crossref.org/works"
 OPENALEX_BASE = "https://api.openalex.org/works"
 REQUEST_TIMEOUT = 20
 RATE_LIMIT_SLEEP = 0.2  # seconds between API calls
+LOOKUP_WORKERS = 8  # concurrent candidate lookups (network-bound)
+
+# Persistent API response cache: repeated runs over the same .bib (the common
+# author-iteration workflow) hit local storage instead of re-querying
+API_CACHE_FILE = Path.home() / ".cache" / "paperef" / "bib_api_cache.json"
+API_CACHE_TTL = 30 * 24 * 3600  # seconds; metadata is effectively immutable
+
+_api_cache: dict[str, Any] | None = None
+_api_cache_lock = threading.Lock()  # lookups run in a thread pool
+_cache_enabled = True
+_cache_refresh = False
+_cache_dirty = False
+
+def _api_cache_get(key: str) -> Any | None:
+    """Return a cached API response, or None on miss/expiry/disabled cache."""
+    global _api_cache
+    if not _cache_enabled or _cache_refresh:
+        return None
+    with _api_cache_lock:
+        if _api_cache is None:
+            _api_cache = load_cache(API_CACHE_FILE)
+        entry = _api_cache.get(key)
+    if entry and time.time() - entry.get("time", 0) < API_CACHE_TTL:
+        return entry["value"]
+    return None
+
+def _api_cache_put(key: str, value: Any) -> None:
+    global _api_cache, _cache_dirty
+    if not _cache_enabled:
+        return
+    with _api_cache_lock:
+        if _api_cache is None:
+            _api_cache = load_cache(API_CACHE_FILE)
+        _api_cache[key] = {"time": time.time(), "value": value}
+        _cache_dirty = True
+
+def _flush_api_cache() -> None:
+    """Write accumulated cache entries to disk (once per run, not per put)."""
+    global _cache_dirty
+    with _api_cache_lock:
+        if not _cache_dirty or _api_cache is None:
+            return
+        snapshot = dict(_api_cache)
+        _cache_dirty = False
+    save_cache(API_CACHE_FILE, snapshot)
+
+def _disk_memoized(fn):
+    """Memoize an API function's JSON-serializable result on disk."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        payload = json.dumps([args, kwargs], sort_keys=True, default=str)
+        key = hashlib.sha1((fn.__name__ + payload).encode("utf-8")).hexdigest()
+        cached = _api_cache_get(key)
+        if cached is not None:
+            return cached
+        value = fn(*args, **kwargs)
+        if value is not None:
+            _api_cache_put(key, value)
+        return value
+    return wrapper
+
+def _doi_cache_key(doi: str) -> str:
+    """Shared per-DOI cache key for single and batch metadata fetches."""
+    return "doi:" + doi.replace("https://doi.org/", "").lower()
 
 PUBLISHER_ADDRESS = {
     "Association for Computing Machinery": "New York, NY, USA",
@@ -193,6 +265,16 @@ VENUE_TO_PUBLISHER = {
     "symposium on geometry processing '": "ACM",
 }
 
+# One alternation over all venue keys (longest first so e.g. "chi play"
+# wins over "chi"): a single C-level scan replaces ~120 Python substring
+# checks per entry
+_VENUE_KEYS = sorted(VENUE_TO_PUBLISHER, key=len, reverse=True)
+_VENUE_RE = re.compile(
+    "|".join(f"(?P<g{i}>{re.escape(key)})" for i, key in enumerate(_VENUE_KEYS)),
+    re.IGNORECASE,
+)
+_VENUE_GROUPS = {f"g{i}": VENUE_TO_PUBLISHER[key] for i, key in enumerate(_VENUE_KEYS)}
+
 # --- Interactive helpers ---
 
 def prompt_text(message: str, default: str = "") -> str:
@@ -256,34 +338,53 @@ def simplify_title(t: str) -> str:
     t = re.sub(r"[^a-z0-9\s]", " ", t)
     return norm_whitespace(t)
 
+# Common LaTeX accent commands, resolved in one regex pass
+_LATEX_ACCENTS = {
+    r"{\i}": "i",
+    r"{\\i}": "i",
+    r"{\c s}": "ş",
+    r"{\c c}": "ç",
+    r"{\'a}": "á",
+    r"{\'e}": "é",
+    r"{\'i}": "í",
+    r"{\'o}": "ó",
+    r"{\'u}": "ú",
+    r'{\"a}': "ä",
+    r'{\"o}': "ö",
+    r'{\"u}': "ü",
+    r"{\^a}": "â",
+    r"{\^e}": "ê",
+    r"{\^i}": "î",
+    r"{\^o}": "ô",
+    r"{\^u}": "û",
+}
+_LATEX_ACCENT_RE = re.compile(r"\{\\{1,2}[^{}]*\}")
+
+# Unicode normalization for better matching - handle common issues
+# (common Unicode characters mapped to ASCII equivalents)
+_UNICODE_TABLE = str.maketrans({
+    "ı": "i",  # dotless i
+    "ş": "s",  # s with cedilla
+    "ç": "c",  # c with cedilla
+    "ğ": "g",  # g with breve
+    "ö": "o",  # o with diaeresis
+    "ü": "u",  # u with diaeresis
+    "İ": "i",  # capital dotless i
+    "Ş": "s",  # capital s with cedilla
+    "Ç": "c",  # capital c with cedilla
+    "Ğ": "g",  # capital g with breve
+    "Ö": "o",  # capital o with diaeresis
+    "Ü": "u",  # capital u with diaeresis
+})
+
 def author_lastnames(authors_field: str) -> list[str]:
     if not authors_field:
         return []
 
     # Handle LaTeX accents before processing
-    # Common LaTeX accent commands
-    accents = {
-        r"{\i}": "i",
-        r"{\\i}": "i",
-        r"{\c s}": "ş",
-        r"{\c c}": "ç",
-        r"{\'a}": "á",
-        r"{\'e}": "é",
-        r"{\'i}": "í",
-        r"{\'o}": "ó",
-        r"{\'u}": "ú",
-        r'{\"a}': "ä",
-        r'{\"o}': "ö",
-        r'{\"u}': "ü",
-        r"{\^a}": "â",
-        r"{\^e}": "ê",
-        r"{\^i}": "î",
-        r"{\^o}": "ô",
-        r"{\^u}": "û",
-    }
-
-    for latex, char in accents.items():
-        authors_field = authors_field.replace(latex, char)
+    authors_field = _LATEX_ACCENT_RE.sub(
+        lambda m: _LATEX_ACCENTS.get(m.group(0), m.group(0)), authors_field
+    )
 
     parts = [a.strip() for a in authors_field.split(" and ") if a.strip()]
     lastnames = []
@@ -291,26 +392,7 @@ def author_lastnames(authors_field: str) -> list[str]:
         # handle {Sitthi-amorn}, Pitchaya
         p = p.strip("{} ")
         last = p.split(",", 1)[0].strip("{} ") if "," in p else p.split()[-1].strip("{} ")
-
-        # Unicode normalization for better matching - handle common issues
-        # Convert common Unicode characters to ASCII equivalents
-        unicode_map = {
-            "ı": "i",  # dotless i
-            "ş": "s",  # s with cedilla
-            "ç": "c",  # c with cedilla
-            "ğ": "g",  # g with breve
-            "ö": "o",  # o with diaeresis
-            "ü": "u",  # u with diaeresis
-            "İ": "i",  # capital dotless i
-            "Ş": "s",  # capital s with cedilla
-            "Ç": "c",  # capital c with cedilla
-            "Ğ": "g",  # capital g with breve
-            "Ö": "o",  # capital o with diaeresis
-            "Ü": "u",  # capital u with diaeresis
-        }
-        for unicode_char, ascii_char in unicode_map.items():
-            last = last.replace(unicode_char, ascii_char)
-        lastnames.append(last.lower())
+        lastnames.append(last.translate(_UNICODE_TABLE).lower())
     return lastnames
 
 def title_similarity(a: str, b: str) -> float:
@@ -369,50 +451,26 @@ def best_candidate_by_score(
 ) -> tuple[dict[str, Any] | None, float]:
     best = None
     best_score = 0.0
+    authors_set = set(authors)
     for it in cands:
         cr_title_list = it.get("title") or []
         cr_title = cr_title_list[0] if cr_title_list else ""
-        sim = title_similarity(title, cr_title)
-
-        # Debug for specific cases
-        if "dowry" in title.lower() and "dowry" in cr_title.lower():
-            print(f"  Debug: Original title: '{title}'")
-            print(f"  Debug: Crossref title: '{cr_title}'")
-            print(f"  Debug: Title similarity: {sim:.2f}")
 
         cr_year = year_from_crossref(it)
         year_score = 1.0 if (year and cr_year and abs(cr_year - year) <= 1) else 0.0
 
-        cr_auth_last = [ (a.get("family") or "").lower() for a in (it.get("author") or []) if isinstance(a, dict) ]
         # Apply Unicode normalization to Crossref authors too
-        unicode_map = {
-            "ı": "i",  # dotless i
-            "ş": "s",  # s with cedilla
-            "ç": "c",  # c with cedilla
-            "ğ": "g",  # g with breve
-            "ö": "o",  # o with diaeresis
-            "ü": "u",  # u with diaeresis
-            "İ": "i",  # capital dotless i
-            "Ş": "s",  # capital s with cedilla
-            "Ç": "c",  # capital c with cedilla
-            "Ğ": "g",  # capital g with breve
-            "Ö": "o",  # capital o with diaeresis
-            "Ü": "u",  # capital u with diaeresis
-        }
-        cr_auth_last = [name.translate(str.maketrans(unicode_map)) for name in cr_auth_last]
+        cr_auth_last = [
+            (a.get("family") or "").lower().translate(_UNICODE_TABLE)
+            for a in (it.get("author") or [])
+            if isinstance(a, dict)
+        ]
         if authors:
-            inter = set(authors) & set(cr_auth_last)
+            inter = authors_set & set(cr_auth_last)
             author_score = min(1.0, len(inter) / max(1, min(len(authors), 3)))
         else:
             author_score = 0.0
 
-        # Debug for specific cases
-        if "dowry" in title.lower() and "dowry" in cr_title.lower():
-            print(f"  Debug: Original authors: {authors}")
-            print(f"  Debug: Crossref authors: {cr_auth_last}")
-            print(f"  Debug: Author intersection: {inter}")
-            print(f"  Debug: Author score: {author_score:.2f}")
-
         # Publisher matching - more flexible
         cr_publisher = (it.get("publisher") or "").lower().strip()
         pub_score = 0.0
@@ -443,13 +501,35 @@ def best_candidate_by_score(
                 oxford_match or cambridge_match):
                 pub_score = 1.0
 
-        score = 0.5*sim + 0.2*author_score + 0.15*year_score + 0.15*pub_score
+        # Title similarity is the expensive component; skip it when even a
+        # perfect title (sim = 1.0) could not beat the current best
+        cheap_score = 0.2*author_score + 0.15*year_score + 0.15*pub_score
+        if 0.5 + cheap_score <= best_score:
+            continue
+
+        sim = title_similarity(title, cr_title)
+
+        # Debug for specific cases
+        if "dowry" in title.lower() and "dowry" in cr_title.lower():
+            print(f"  Debug: Original title: '{title}'")
+            print(f"  Debug: Crossref title: '{cr_title}'")
+            print(f"  Debug: Title similarity: {sim:.2f}")
+            print(f"  Debug: Original authors: {authors}")
+            print(f"  Debug: Crossref authors: {cr_auth_last}")
+            print(f"  Debug: Author score: {author_score:.2f}")
+
+        score = 0.5*sim + cheap_score
         if score > best_score:
             best, best_score = it, score
+            # A near-perfect match will not be displaced by later candidates
+            # in any meaningful way; stop scanning
+            if best_score >= 0.95:
+                break
     return best, best_score
 
 # --- Query functions ---
 
+@_disk_memoized
 def query_crossref(title: str, authors: list[str], year: int | None, rows: int = 8) -> list[dict[str, Any]]:
     # Clean title for API query - remove special characters that cause issues
     clean_title = re.sub(r"[{}()\[\]]", "", title)  # Remove braces, parentheses, brackets
@@ -480,6 +560,9 @@ def fetch_doi_metadata(doi: str) -> dict[str, Any] | None:
         return None
     # Strip prefix if present
     doi = doi.replace("https://doi.org/", "")
+    cached = _api_cache_get(_doi_cache_key(doi))
+    if cached is not None:
+        return cached
     url = f"{CROSSREF_BASE}/{doi}"
     headers = {
         "User-Agent": f"bib-doi-enricher/1.0 (mailto:{CONTACT_EMAIL})"
@@ -490,10 +573,60 @@ def fetch_doi_metadata(doi: str) -> dict[str, Any] | None:
         data = r.json()
         item = safe_get(data, "message", default={})
         time.sleep(RATE_LIMIT_SLEEP)
+        if item:
+            _api_cache_put(_doi_cache_key(doi), item)
         return item
     except requests.RequestException:
         return None
 
+def fetch_doi_metadata_batch(dois: list[str]) -> dict[str, dict[str, Any]]:
+    """Fetch Crossref metadata for many DOIs with filter=doi: batch queries.
+
+    N per-DOI GET /works/{doi} round-trips collapse to ceil(N/40) requests;
+    results are indexed by lowercased DOI. Failed batches are simply absent
+    from the result so callers can fall back to fetch_doi_metadata.
+    """
+    metadata: dict[str, dict[str, Any]] = {}
+    dois = [d.replace("https://doi.org/", "") for d in dois if d]
+    if not dois:
+        return metadata
+
+    # Per-DOI cache consultation so partial hits still shrink the batches
+    misses = []
+    for d in dois:
+        cached = _api_cache_get(_doi_cache_key(d))
+        if cached is not None:
+            metadata[d.lower()] = cached
+        else:
+            misses.append(d)
+    dois = misses
+
+    headers = {
+        "User-Agent": f"bib-doi-enricher/1.0 (mailto:{CONTACT_EMAIL})"
+    }
+    # ~40 DOIs per request keeps the query string inside common URL budgets
+    for start in range(0, len(dois), 40):
+        chunk = dois[start:start + 40]
+        params = {
+            "filter": ",".join(f"doi:{d}" for d in chunk),
+            "rows": len(chunk),
+            "select": "DOI,title,author,issued,container-title,short-container-title,publisher,page,article-number,volume,issue,journal-issue,ISSN,ISBN,type",
+        }
+        try:
+            r = requests.get(CROSSREF_BASE, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+            r.raise_for_status()
+            items = safe_get(r.json(), "message", "items", default=[]) or []
+        except requests.RequestException:
+            continue
+        for item in items:
+            item_doi = (item.get("DOI") or "").lower()
+            if item_doi:
+                metadata[item_doi] = item
+                _api_cache_put(_doi_cache_key(item_doi), item)
+        time.sleep(RATE_LIMIT_SLEEP)
+    return metadata
+
+@_disk_memoized
 def query_openalex(title: str, authors: list[str], year: int | None, per_page: int = 8) -> list[dict[str, Any]]:
     # Clean title for API query
     clean_title = re.sub(r"[{}()\[\]]", "", title)
@@ -566,11 +699,8 @@ def infer_publisher_from_venue(venue: str) -> str | None:
     """Infer publisher from venue name."""
     if not venue:
         return None
-    venue_lower = venue.lower()
-    for key, pub in VENUE_TO_PUBLISHER.items():
-        if key.lower() in venue_lower:
-            return pub
-    return None
+    m = _VENUE_RE.search(venue)
+    return _VENUE_GROUPS[m.lastgroup] if m else None
 
 def normalize_publisher_address(entry: dict[str, Any]) -> None:
     pub = entry.get("publisher")
@@ -685,6 +815,18 @@ def enrich_entry(entry: dict[str, Any], best: dict[str, Any], acm_pages_to_artic
 
 # --- Main processing ---
 
+def _lookup_candidates(title: str, authors: list[str], year: int | None, prefer_openalex: bool) -> list[dict[str, Any]]:
+    """Run the primary/fallback candidate queries for a single entry."""
+    if prefer_openalex:
+        items = query_openalex(title, authors, year)
+        if not items:
+            items = query_crossref(title, authors, year)
+    else:
+        items = query_crossref(title, authors, year)
+        if not items:
+            items = query_openalex(title, authors, year)
+    return items
+
 def process_bibtex(
     input_path: str,
     output_path: str,
@@ -697,15 +839,48 @@ def process_bibtex(
         parser = BibTexParser(common_strings=True)
         db = bibtexparser.load(f, parser=parser)
 
-    updated = 0
-    total = len(db.entries)
+    # Lookup phase: the candidate queries are blocking network I/O, so run
+    # them on a small thread pool instead of one round-trip at a time. The
+    # apply phase below consumes results strictly in input order, keeping
+    # prompts and console output identical to the sequential version.
+    entry_meta = []
     for e in db.entries:
         title = e.get("title") or ""
         authors = author_lastnames(e.get("author",""))
         year = None
         with suppress(Exception):
             year = int(str(e.get("year","")).strip()[:4])
+        entry_meta.append((title, authors, year))
+
+    def lookup(meta):
+        title, authors, year = meta
+        if not title.strip():
+            return None
+        try:
+            return _lookup_candidates(title, authors, year, prefer_openalex)
+        except requests.RequestException as ex:
+            return ex
+
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        lookup_results = list(executor.map(lookup, entry_meta))
+
+    # Score each entry's candidates up front and batch-fetch the full
+    # Crossref records for the confident matches in one pass
+    scored = []
+    prefetch_dois = []
+    for e, (title, authors, year), items in zip(db.entries, entry_meta, lookup_results, strict=False):
+        if not title.strip() or not isinstance(items, list) or not items:
+            scored.append((None, 0.0))
+            continue
+        best, score = best_candidate_by_score(items, title, authors, year, e.get("publisher"))
+        scored.append((best, score))
+        if best and score >= min_score and best.get("DOI"):
+            prefetch_dois.append(best["DOI"])
+    doi_metadata = fetch_doi_metadata_batch(prefetch_dois)
 
+    updated = 0
+    total = len(db.entries)
+    for idx, (e, (title, authors, year), items) in enumerate(zip(db.entries, entry_meta, lookup_results, strict=False)):
         if not title.strip():
             print(f"- Skipping {e.get('ID')} (no title)")
             continue
@@ -713,21 +888,11 @@ def process_bibtex(
         already_has_doi = bool(e.get("doi"))
         print(f"* {e.get('ID')} | title='{title[:60]}{'...' if len(title)>60 else ''}' | DOI: {'yes' if already_has_doi else 'no'}")
 
-        items: list[dict[str, Any]] = []
-        try:
-            if prefer_openalex:
-                items = query_openalex(title, authors, year)
-                if not items:
-                    items = query_crossref(title, authors, year)
-            else:
-                items = query_crossref(title, authors, year)
-                if not items:
-                    items = query_openalex(title, authors, year)
-        except requests.HTTPError as ex:
-            print(f"  ! HTTP error: {ex}")
+        if isinstance(items, requests.HTTPError):
+            print(f"  ! HTTP error: {items}")
             continue
-        except requests.RequestException as ex:
-            print(f"  ! Request error: {ex}")
+        if isinstance(items, requests.RequestException):
+            print(f"  ! Request error: {items}")
             continue
 
         if not items:
@@ -751,8 +916,7 @@ def process_bibtex(
                         updated += 1  # At least DOI was added
             continue
 
-        publisher = e.get("publisher")
-        best, score = best_candidate_by_score(items, title, authors, year, publisher)
+        best, score = scored[idx]
         selected_item = best
         if interactive and (not best or score < min_score):
             print(f"  ! Low confidence match (score={score:.2f}). Showing candidates.")
@@ -769,10 +933,11 @@ def process_bibtex(
         else:
             print(f"  + Matched DOI: {best.get('DOI')} (score={score:.2f}) via {'OpenAlex' if prefer_openalex else 'Crossref'}")
 
-        # Fetch full metadata if DOI is available
+        # Fetch full metadata if DOI is available (prefetched batch first,
+        # per-DOI request only for interactive picks outside the batch)
         if selected_item and selected_item.get("DOI"):
             doi_clean = selected_item["DOI"].replace("https://doi.org/", "")
-            full_meta = fetch_doi_metadata(doi_clean)
+            full_meta = doi_metadata.get(doi_clean.lower()) or fetch_doi_metadata(doi_clean)
             if full_meta:
                 # Merge full metadata into selected_item
                 selected_item.update(full_meta)
@@ -829,19 +994,28 @@ def main():
     ap.add_argument("--min-score", type=float, default=0.72,
                     help="Minimum match score to accept (0-1)")
     ap.add_argument("--non-interactive", action="store_true", help="Run without interactive prompts")
+    ap.add_argument("--no-cache", action="store_true", help="Disable the on-disk API response cache")
+    ap.add_argument("--refresh-cache", action="store_true", help="Re-query the APIs and overwrite cached responses")
     args = ap.parse_args()
 
+    global _cache_enabled, _cache_refresh
+    _cache_enabled = not args.no_cache
+    _cache_refresh = args.refresh_cache
+
     if CONTACT_EMAIL == "youremail@example.com":
         print("WARNING: Please edit CONTACT_EMAIL in the script to your email for polite API usage.", file=sys.stderr)
 
-    process_bibtex(
-        args.input,
-        args.output,
-        prefer_openalex=args.prefer_openalex,
-        acm_pages_to_article=args.acm_pages_to_article,
-        min_score=args.min_score,
-        interactive=not args.non_interactive
-    )
+    try:
+        process_bibtex(
+            args.input,
+            args.output,
+            prefer_openalex=args.prefer_openalex,
+            acm_pages_to_article=args.acm_pages_to_article,
+            min_score=args.min_score,
+            interactive=not args.non_interactive
+        )
+    finally:
+        _flush_api_cache()
 
 if __name__ == "__main__":
     main()
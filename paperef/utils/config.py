@@ -32,6 +32,7 @@ class Config:
     interactive: bool = True
     no_interactive: bool = False
     skip_pdf: bool = False
+    workers: int | None = None  # batch conversion processes (None = cpu count)
 
     # BibTeX key generation settings
     bibtex_key_style: str = "google"  # "google" | "standard"
@@ -4,6 +4,7 @@ File I/O utility module
 
 import hashlib
 import json
+import os
 import re
 import shutil
 from pathlib import Path
@@ -39,12 +40,9 @@ def save_cache(cache_file: Path, data: dict[str, Any]) -> None:
 
 
 def get_file_hash(file_path: Path) -> str:
-    """Calculate file hash"""
-    hash_sha256 = hashlib.sha256()
+    """Calculate file hash (streamed: constant memory regardless of file size)"""
     with file_path.open("rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_sha256.update(chunk)
-    return hash_sha256.hexdigest()[:8]
+        return hashlib.file_digest(f, "sha256").hexdigest()[:8]
 
 
 def sanitize_filename(filename: str) -> str:
@@ -96,6 +94,25 @@ def write_text_file(file_path: Path, content: str, encoding: str = "utf-8") -> b
         return False
 
 
+def write_binary_file(file_path: Path, data: bytes) -> bool:
+    """Write small binary payload with a single low-level os.write"""
+    try:
+        fd = os.open(os.fspath(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    except OSError:
+        return False
+
+    try:
+        # Loop for robustness on large payloads (os.write may be partial)
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+    return True
+
+
 def copy_file(src: Path, dst: Path) -> bool:
     """Copy file"""
     try: